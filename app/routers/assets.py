@@ -7,7 +7,7 @@ from datetime import datetime
 
 from app import templates
 from models import (
-    get_db, User, Vendor, Control, Asset, AssetControlMapping,
+    get_db, User, Vendor, Asset, AssetControlMapping,
     VALID_ASSET_TYPES, ASSET_TYPE_LABELS, ASSET_TYPE_ICONS,
     VALID_ASSET_STATUSES, ASSET_STATUS_LABELS, ASSET_STATUS_COLORS,
     AUDIT_ACTION_CREATE, AUDIT_ACTION_UPDATE, AUDIT_ACTION_DELETE,
@@ -16,6 +16,7 @@ from models import (
 from app.services.auth_service import require_role, require_login
 from app.services.audit_service import log_audit
 from app.services import asset_service as svc
+from app.services.control_service import control_picker_options
 
 router = APIRouter()
 _analyst_dep = require_role("admin", "analyst")
@@ -161,7 +162,7 @@ async def asset_detail(
     asset = svc.get_asset(db, asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
-    all_controls = db.query(Control).filter(Control.is_active == True).order_by(Control.control_ref).all()
+    all_controls = control_picker_options(db)
     return templates.TemplateResponse("asset_detail.html", {
         "request": request,
         "asset": asset,
@@ -8,7 +8,7 @@ from app import templates
 from models import (
     get_db, User, Vendor, RiskException,
     EXCEPTION_STATUS_PENDING, EXCEPTION_STATUS_APPROVED, EXCEPTION_STATUS_REJECTED,
-    VALID_EXCEPTION_STATUSES,
+    VALID_EXCEPTION_STATUSES_ORDERED,
     ACTIVITY_EXCEPTION_CREATED, ACTIVITY_EXCEPTION_APPROVED,
     NOTIF_EXCEPTION_REQUESTED, NOTIF_EXCEPTION_APPROVED,
 )
@@ -34,7 +34,7 @@ async def exceptions_list(request: Request, db: Session = Depends(get_db),
         "request": request,
         "pending": pending,
         "all_exceptions": all_exceptions,
-        "statuses": VALID_EXCEPTION_STATUSES,
+        "statuses": VALID_EXCEPTION_STATUSES_ORDERED,
     })
 
 
@@ -51,7 +51,7 @@ async def vendor_exceptions(request: Request, vendor_id: int,
         "vendor": vendor,
         "pending": [e for e in exceptions if e.status == EXCEPTION_STATUS_PENDING],
         "all_exceptions": exceptions,
-        "statuses": VALID_EXCEPTION_STATUSES,
+        "statuses": VALID_EXCEPTION_STATUSES_ORDERED,
     })
 
 
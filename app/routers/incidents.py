@@ -7,7 +7,7 @@ from datetime import datetime
 
 from app import templates
 from models import (
-    get_db, User, Vendor, Control, Risk,
+    get_db, User, Vendor, Risk,
     Incident, IncidentTimeline, IncidentControlMapping, IncidentRiskMapping,
     VALID_INCIDENT_SEVERITIES, INCIDENT_SEVERITY_LABELS, INCIDENT_SEVERITY_COLORS,
     VALID_INCIDENT_STATUSES, INCIDENT_STATUS_LABELS, INCIDENT_STATUS_COLORS,
@@ -18,6 +18,7 @@ from models import (
 from app.services.auth_service import require_role, require_login
 from app.services.audit_service import log_audit
 from app.services import incident_service as svc
+from app.services.control_service import control_picker_options
 
 router = APIRouter()
 _analyst_dep = require_role("admin", "analyst")
@@ -163,7 +164,7 @@ async def incident_detail(
     incident = svc.get_incident(db, incident_id)
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
-    all_controls = db.query(Control).filter(Control.is_active == True).order_by(Control.control_ref).all()
+    all_controls = control_picker_options(db)
     all_risks = db.query(Risk).filter(Risk.is_active == True).order_by(Risk.risk_ref).all()
     return templates.TemplateResponse("incident_detail.html", {
         "request": request,
@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from app import templates
 from models import (
     get_db, User, VendorIntakeRequest,
-    VALID_INTAKE_URGENCIES, VALID_INTAKE_STATUSES,
+    VALID_INTAKE_URGENCIES, VALID_INTAKE_URGENCIES_ORDERED, VALID_INTAKE_STATUSES_ORDERED,
     INTAKE_STATUS_PENDING,
     NOTIF_INTAKE_SUBMITTED, NOTIF_INTAKE_APPROVED, NOTIF_INTAKE_REJECTED,
 )
@@ -26,7 +26,7 @@ async def intake_form_page(request: Request, db: Session = Depends(get_db),
                            current_user: User = Depends(require_login)):
     return templates.TemplateResponse("intake_form.html", {
         "request": request,
-        "urgencies": VALID_INTAKE_URGENCIES,
+        "urgencies": VALID_INTAKE_URGENCIES_ORDERED,
     })
 
 
@@ -46,7 +46,7 @@ async def submit_intake(
     if not vendor_name.strip():
         return templates.TemplateResponse("intake_form.html", {
             "request": request,
-            "urgencies": VALID_INTAKE_URGENCIES,
+            "urgencies": VALID_INTAKE_URGENCIES_ORDERED,
             "error": "Vendor name is required.",
         })
 
@@ -79,7 +79,7 @@ async def intake_list(request: Request, db: Session = Depends(get_db),
         "request": request,
         "intake_requests": requests_list,
         "pending_count": pending_count,
-        "statuses": VALID_INTAKE_STATUSES,
+        "statuses": VALID_INTAKE_STATUSES_ORDERED,
     })
 
 
@@ -7,7 +7,7 @@ from datetime import datetime
 
 from app import templates
 from models import (
-    get_db, User, Control, Policy,
+    get_db, User, Policy,
     VALID_POLICY_TYPES, POLICY_TYPE_LABELS,
     VALID_POLICY_STATUSES, POLICY_STATUS_LABELS, POLICY_STATUS_COLORS,
     POLICY_STATUS_DRAFT, POLICY_STATUS_UNDER_REVIEW, POLICY_STATUS_APPROVED,
@@ -20,6 +20,7 @@ from app.services.auth_service import require_role, require_login
 from app.services.audit_service import log_audit
 from app.services import policy_service as svc
 from app.services import policy_dashboard_service as dash_svc
+from app.services.control_service import control_picker_options
 
 router = APIRouter()
 _analyst_dep = require_role("admin", "analyst")
@@ -222,7 +223,7 @@ async def policy_detail(
     policy = svc.get_policy(db, policy_id)
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
-    all_controls = db.query(Control).filter(Control.is_active == True).order_by(Control.control_ref).all()
+    all_controls = control_picker_options(db)
     ack_status = svc.get_acknowledgment_status(db, policy_id)
     # Check if current user has acknowledged
     from models import PolicyAcknowledgment
@@ -12,7 +12,7 @@ from models import (
     VALID_RA_STATUSES, RA_STATUS_LABELS, RA_STATUS_COLORS,
     VALID_RAI_STATUSES, RAI_STATUS_LABELS, RAI_STATUS_COLORS,
     VALID_ASSESSMENT_METHODOLOGIES, ASSESSMENT_METHODOLOGY_LABELS,
-    VALID_INTAKE_STATUSES, INTAKE_STATUS_LABELS, INTAKE_STATUS_COLORS,
+    VALID_INTAKE_STATUSES_ORDERED, INTAKE_STATUS_LABELS, INTAKE_STATUS_COLORS,
     VALID_INTAKE_SEVERITIES, INTAKE_SEVERITY_LABELS, INTAKE_SEVERITY_COLORS,
     VALID_RISK_SOURCES, RISK_SOURCE_LABELS,
     VALID_CONFIDENCE_LEVELS, CONFIDENCE_LEVEL_LABELS,
@@ -303,7 +303,7 @@ async def intake_list(
         "intakes": intakes,
         "stats": stats,
         "filters": {"status": status, "severity": severity},
-        "VALID_INTAKE_STATUSES": VALID_INTAKE_STATUSES,
+        "VALID_INTAKE_STATUSES": VALID_INTAKE_STATUSES_ORDERED,
         "INTAKE_STATUS_LABELS": INTAKE_STATUS_LABELS,
         "INTAKE_STATUS_COLORS": INTAKE_STATUS_COLORS,
         "VALID_INTAKE_SEVERITIES": VALID_INTAKE_SEVERITIES,
@@ -379,7 +379,7 @@ async def intake_detail(
         "request": request,
         "intake": intake,
         "users": users,
-        "VALID_INTAKE_STATUSES": VALID_INTAKE_STATUSES,
+        "VALID_INTAKE_STATUSES": VALID_INTAKE_STATUSES_ORDERED,
         "INTAKE_STATUS_LABELS": INTAKE_STATUS_LABELS,
         "INTAKE_STATUS_COLORS": INTAKE_STATUS_COLORS,
         "INTAKE_SEVERITY_LABELS": INTAKE_SEVERITY_LABELS,
@@ -52,6 +52,21 @@ def _form_context(db: Session, statement=None, error=None):
     }
 
 
+def _duplicate_exists(db: Session, category: str, trigger_condition: str, finding_text: str, exclude_id: int | None = None) -> bool:
+    """True if an identical category-level statement exists (enforced by uq_rs_cat_trig_text)."""
+    if trigger_condition == TRIGGER_QUESTION_ANSWERED:
+        return False
+    q = db.query(RiskStatement.id).filter(
+        RiskStatement.category == category,
+        RiskStatement.trigger_condition == trigger_condition,
+        RiskStatement.finding_text == finding_text,
+        RiskStatement.trigger_question_id == None,
+    )
+    if exclude_id is not None:
+        q = q.filter(RiskStatement.id != exclude_id)
+    return q.first() is not None
+
+
 @router.get("/risk-library", response_class=HTMLResponse)
 async def risk_library_list(request: Request, db: Session = Depends(get_db), current_user: User = Depends(_analyst_dep)):
     statements = db.query(RiskStatement).options(
@@ -110,6 +125,11 @@ async def risk_library_create(
         ctx["request"] = request
         return templates.TemplateResponse("risk_library_edit.html", ctx)
 
+    if _duplicate_exists(db, category.strip(), trigger_condition, finding_text.strip()):
+        ctx = _form_context(db, error="An identical risk statement already exists for this category and trigger.")
+        ctx["request"] = request
+        return templates.TemplateResponse("risk_library_edit.html", ctx)
+
     stmt = RiskStatement(
         category=category.strip(),
         trigger_condition=trigger_condition,
@@ -179,6 +199,11 @@ async def risk_library_update(
         ctx["request"] = request
         return templates.TemplateResponse("risk_library_edit.html", ctx)
 
+    if _duplicate_exists(db, category.strip(), trigger_condition, finding_text.strip(), exclude_id=stmt.id):
+        ctx = _form_context(db, statement=stmt, error="An identical risk statement already exists for this category and trigger.")
+        ctx["request"] = request
+        return templates.TemplateResponse("risk_library_edit.html", ctx)
+
     stmt.category = category.strip()
     stmt.trigger_condition = trigger_condition
     stmt.severity = severity
@@ -7,7 +7,7 @@ from datetime import datetime
 
 from app import templates
 from models import (
-    get_db, User, Control, Policy, Risk,
+    get_db, User, Policy, Risk,
     VALID_RISK_SOURCES, RISK_SOURCE_LABELS,
     VALID_RISK_STATUSES, RISK_STATUS_LABELS, RISK_STATUS_COLORS,
     VALID_TREATMENT_TYPES, TREATMENT_TYPE_LABELS,
@@ -21,6 +21,7 @@ from app.services.auth_service import require_role, require_login
 from app.services.audit_service import log_audit
 from app.services import risk_service as svc
 from app.services import risk_dashboard_service as dash_svc
+from app.services.control_service import control_picker_options
 
 router = APIRouter()
 _analyst_dep = require_role("admin", "analyst")
@@ -154,7 +155,7 @@ async def risk_detail(
     risk = svc.get_risk(db, risk_id)
     if not risk:
         raise HTTPException(status_code=404, detail="Risk not found")
-    all_controls = db.query(Control).filter(Control.is_active == True).order_by(Control.control_ref).all()
+    all_controls = control_picker_options(db)
     all_policies = db.query(Policy).filter(Policy.is_active == True).order_by(Policy.policy_ref).all()
     return templates.TemplateResponse("risk_detail.html", {
         "request": request,
@@ -1,7 +1,6 @@
 """Audit readiness service — project CRUD, PBC generation, evidence linking, binder export."""
 
 import os
-import json
 import zipfile
 import tempfile
 from datetime import datetime
@@ -10,7 +9,7 @@ from sqlalchemy import func
 
 from models import (
     AuditProject, AuditRequest, AuditRequestEvidence,
-    FrameworkRequirement, FrameworkAdoption, ControlEvidence,
+    FrameworkRequirement, FrameworkAdoption, ControlEvidenceFrameworkTag,
     Policy, PolicyFrameworkMapping, VendorDocument,
     User, ADOPTION_STATUS_MAPPED,
 )
@@ -110,7 +109,7 @@ def generate_pbc_list(db: Session, project_id: int) -> dict:
 
 
 def auto_link_evidence(db: Session, project_id: int) -> dict:
-    """Scan ControlEvidence with matching framework_tags + policies with matching framework mappings."""
+    """Link ControlEvidence tagged with the project framework + policies with matching framework mappings."""
     project = db.query(AuditProject).filter(AuditProject.id == project_id).first()
     if not project:
         return {"linked": 0}
@@ -119,6 +118,13 @@ def auto_link_evidence(db: Session, project_id: int) -> dict:
         AuditRequest.audit_project_id == project_id,
     ).all()
 
+    # Evidence tagged with the project's framework (index seek on the tag table)
+    tagged_evidence_ids = [
+        row.evidence_id for row in db.query(ControlEvidenceFrameworkTag.evidence_id).filter(
+            ControlEvidenceFrameworkTag.framework == project.framework,
+        ).order_by(ControlEvidenceFrameworkTag.evidence_id).distinct()
+    ]
+
     linked = 0
     for req in requests:
         if not req.requirement_reference:
@@ -133,25 +139,17 @@ def auto_link_evidence(db: Session, project_id: int) -> dict:
             if el.policy_id:
                 existing_policy_ids.add(el.policy_id)
 
-        # Find control evidence with matching framework tags
-        all_evidence = db.query(ControlEvidence).filter(
-            ControlEvidence.framework_tags != None,
-        ).all()
-        for ev in all_evidence:
-            if ev.id in existing_evidence_ids:
+        # Link control evidence with matching framework tags
+        for evidence_id in tagged_evidence_ids:
+            if evidence_id in existing_evidence_ids:
                 continue
-            try:
-                tags = json.loads(ev.framework_tags) if ev.framework_tags else []
-            except (json.JSONDecodeError, TypeError):
-                tags = []
-            if project.framework in tags:
-                db.add(AuditRequestEvidence(
-                    audit_request_id=req.id,
-                    evidence_type="CONTROL_EVIDENCE",
-                    control_evidence_id=ev.id,
-                    notes="Auto-linked by framework tag match",
-                ))
-                linked += 1
+            db.add(AuditRequestEvidence(
+                audit_request_id=req.id,
+                evidence_type="CONTROL_EVIDENCE",
+                control_evidence_id=evidence_id,
+                notes="Auto-linked by framework tag match",
+            ))
+            linked += 1
 
         # Find policies with matching framework mappings
         policy_mappings = db.query(PolicyFrameworkMapping).filter(
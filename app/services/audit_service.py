@@ -5,7 +5,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
-from models import AuditLog, User
+from models import AuditLog, User, compute_audit_row_hash
 
 
 def log_audit(
@@ -78,3 +78,22 @@ def get_audit_page(
     records = query.order_by(desc(AuditLog.timestamp)).offset(offset).limit(limit).all()
 
     return records, total
+
+
+def verify_audit_chain(db: Session, batch_size: int = 1000) -> int | None:
+    """Stream audit_logs in id order and recompute the hash chain.
+
+    Returns the id of the first row that breaks the chain, or None if intact.
+    Rows written before the chain columns existed (row_hash NULL) are skipped
+    until the first hashed row.
+    """
+    prev_hash = None
+    started = False
+    for entry in db.query(AuditLog).order_by(AuditLog.id).yield_per(batch_size):
+        if entry.row_hash is None and not started:
+            continue
+        started = True
+        if entry.prev_hash != prev_hash or entry.row_hash != compute_audit_row_hash(entry, prev_hash):
+            return entry.id
+        prev_hash = entry.row_hash
+    return None
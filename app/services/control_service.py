@@ -1,16 +1,16 @@
 """Control library service — CRUD for controls, implementations, testing, and evidence."""
 
 import os
+import json
 import uuid
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
 from sqlalchemy import func
 
 from models import (
     Control, ControlFrameworkMapping, ControlQuestionMapping, ControlRiskMapping,
-    ControlImplementation, ControlTest, ControlEvidence, ControlFinding,
+    ControlImplementation, ControlTest, ControlEvidence, ControlEvidenceFrameworkTag, ControlFinding,
     IMPL_STATUS_NOT_IMPLEMENTED, IMPL_STATUS_IMPLEMENTED,
-    CONTROL_FREQUENCY_DAYS,
     TEST_STATUS_SCHEDULED, TEST_STATUS_IN_PROGRESS, TEST_STATUS_COMPLETED,
     TEST_RESULT_NOT_TESTED,
     FINDING_STATUS_OPEN, FINDING_STATUS_CLOSED,
@@ -29,11 +29,18 @@ def get_all_controls(db: Session, active_only: bool = True):
     return q.order_by(Control.domain, Control.control_ref).all()
 
 
+def control_picker_options(db: Session):
+    """Active controls for the link pickers; only id/ref/title/domain are loaded."""
+    return db.query(Control).options(
+        load_only(Control.id, Control.control_ref, Control.title, Control.domain)
+    ).filter(Control.is_active == True).order_by(Control.control_ref).all()
+
+
 def get_control(db: Session, control_id: int):
     return db.query(Control).options(
-        joinedload(Control.framework_mappings),
-        joinedload(Control.question_mappings).joinedload(ControlQuestionMapping.question_bank_item),
-        joinedload(Control.risk_mappings).joinedload(ControlRiskMapping.risk_statement),
+        selectinload(Control.framework_mappings),
+        selectinload(Control.question_mappings).joinedload(ControlQuestionMapping.question_bank_item),
+        selectinload(Control.risk_mappings).joinedload(ControlRiskMapping.risk_statement),
         joinedload(Control.owner),
     ).filter(Control.id == control_id).first()
 
@@ -168,7 +175,7 @@ def get_implementation(db: Session, impl_id: int):
         joinedload(ControlImplementation.control).joinedload(Control.framework_mappings),
         joinedload(ControlImplementation.vendor),
         joinedload(ControlImplementation.owner),
-        joinedload(ControlImplementation.tests).joinedload(ControlTest.tester),
+        selectinload(ControlImplementation.tests).joinedload(ControlTest.tester),
     ).filter(ControlImplementation.id == impl_id).first()
 
 
@@ -364,7 +371,7 @@ def get_upcoming_tests(db: Session, days: int = 30):
 def update_next_test_date(db: Session, implementation):
     if not implementation or not implementation.control:
         return
-    freq_days = CONTROL_FREQUENCY_DAYS.get(implementation.control.test_frequency, 365)
+    freq_days = implementation.control.test_frequency_days
     latest_test = db.query(ControlTest).filter(
         ControlTest.implementation_id == implementation.id
     ).order_by(ControlTest.test_date.desc()).first()
@@ -694,11 +701,20 @@ def get_implementation_evidence(db: Session, impl_id: int) -> list:
 
 
 def update_evidence_framework_tags(db: Session, evidence_id: int, tags_json: str) -> ControlEvidence | None:
-    """Update the framework_tags JSON on an evidence file."""
+    """Replace the framework tags on an evidence file from a JSON list of framework keys."""
     ev = db.query(ControlEvidence).filter(ControlEvidence.id == evidence_id).first()
     if not ev:
         return None
-    ev.framework_tags = tags_json
+    try:
+        tags = json.loads(tags_json) if tags_json else []
+    except (json.JSONDecodeError, TypeError):
+        tags = []
+    if not isinstance(tags, list):
+        tags = []
+    ev.framework_tag_links = [
+        ControlEvidenceFrameworkTag(framework=fw)
+        for fw in dict.fromkeys(t for t in tags if isinstance(t, str))
+    ]
     db.flush()
     return ev
 
@@ -1,7 +1,7 @@
 """Framework requirement service — CRUD, adoption workflow, coverage stats, cross-mapping."""
 
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func
 
 from models import (
@@ -363,7 +363,9 @@ def bulk_adopt_unmapped(db: Session, framework: str, user_id: int) -> dict:
 
 def get_cross_framework_mappings(db: Session) -> list:
     """Controls mapped to 2+ frameworks for cross-reference view."""
-    controls = db.query(Control).filter(Control.is_active == True).all()
+    controls = db.query(Control).options(
+        selectinload(Control.framework_mappings),
+    ).filter(Control.is_active == True).all()
     result = []
     for c in controls:
         if len(c.framework_mappings) < 2:
@@ -8,7 +8,6 @@ from models import (
     ControlHealthSnapshot,
     IMPL_STATUS_IMPLEMENTED, IMPL_STATUS_PARTIAL, IMPL_STATUS_PLANNED,
     IMPL_STATUS_NOT_IMPLEMENTED, IMPL_STATUS_NOT_APPLICABLE,
-    CONTROL_FREQUENCY_DAYS,
     TEST_STATUS_COMPLETED,
     FINDING_STATUS_OPEN, FINDING_STATUS_IN_PROGRESS,
 )
@@ -49,9 +48,7 @@ def _score_testing_recency(db: Session, impl: ControlImplementation) -> int:
         return 0
 
     # Determine the required frequency in days
-    freq_days = CONTROL_FREQUENCY_DAYS.get(
-        impl.control.test_frequency if impl.control else None, 365
-    )
+    freq_days = impl.control.test_frequency_days if impl.control else 365
 
     now = datetime.utcnow()
     days_since_test = (now - latest_test.test_date).days
@@ -214,7 +211,7 @@ def compute_readiness(db: Session, impl: ControlImplementation) -> dict:
 
         # Check if testing is current (within required frequency)
         if latest_test.test_date and impl.control:
-            freq_days = CONTROL_FREQUENCY_DAYS.get(impl.control.test_frequency, 365)
+            freq_days = impl.control.test_frequency_days
             days_since = (datetime.utcnow() - latest_test.test_date).days
             testing_current = days_since <= freq_days
 
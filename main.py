@@ -13,18 +13,14 @@ from fastapi import FastAPI
 from datetime import datetime
 
 from models import (
-    init_db, get_db, seed_question_bank, seed_risk_statements,
+    init_db, optimize_db, get_db, seed_question_bank, seed_risk_statements,
     backfill_question_categories, backfill_question_bank_item_ids,
-    backfill_vendor_new_columns, backfill_decision_scores,
-    backfill_template_columns, backfill_auth_columns,
-    backfill_new_feature_columns, backfill_approval_columns,
+    backfill_decision_scores, ensure_feature_indexes,
     seed_default_templates, seed_default_admin,
     seed_default_tiering_rules, ensure_scoring_config,
-    backfill_sla_columns, ensure_sla_configs,
-    backfill_onboarding_column,
-    backfill_controls_tables, seed_default_controls,
-    backfill_framework_tables, seed_framework_requirements,
-    sync_adoptions_from_existing_mappings, update_control_enrichments,
+    run_backfills, backfill_audit_payload_compression, ensure_sla_configs,
+    backfill_controls_tables, initialize_controls,
+    backfill_framework_tables,
     backfill_custom_frameworks_table, backfill_policy_tables,
     backfill_risk_tables, backfill_audit_project_tables,
     backfill_incident_tables, backfill_asset_tables,
@@ -49,13 +45,9 @@ from app.services.auth_service import get_current_user
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 init_db()
-backfill_vendor_new_columns()
-backfill_template_columns()
-backfill_auth_columns()
-backfill_new_feature_columns()
-backfill_approval_columns()
-backfill_sla_columns()
-backfill_onboarding_column()
+run_backfills()
+ensure_feature_indexes()
+backfill_audit_payload_compression()
 backfill_controls_tables()
 backfill_framework_tables()
 backfill_custom_frameworks_table()
@@ -71,10 +63,7 @@ seed_risk_statements()
 seed_default_templates()
 seed_default_admin()
 seed_default_tiering_rules()
-seed_default_controls()
-seed_framework_requirements()
-sync_adoptions_from_existing_mappings()
-update_control_enrichments()
+initialize_controls()
 backfill_question_categories()
 backfill_question_bank_item_ids()
 backfill_decision_scores()
@@ -92,6 +81,9 @@ try:
 finally:
     _db.close()
 
+# Startup seeding/migrations are done; let SQLite refresh planner statistics
+optimize_db()
+
 
 @asynccontextmanager
 async def lifespan(app):
@@ -1,11 +1,48 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Float, text
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Float, Index, text, func, literal_column, insert, SmallInteger
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, object_session
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from enum import IntEnum
+import hashlib
+import json
+import zlib
+
+DATABASE_PATH = "./questionnaires.db"
+DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+
+# Applied to every new SQLite connection. WAL + synchronous=NORMAL avoids a full fsync
+# per commit; the larger page cache (64 MB) and in-memory temp store help bulk seeding.
+# foreign_keys stays off: the table-rebuild backfills DROP tables that others reference.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def apply_sqlite_pragmas(dbapi_conn):
+    """Run SQLITE_PRAGMAS on a raw DB-API connection in one executescript call."""
+    dbapi_conn.executescript(";\n".join(SQLITE_PRAGMAS) + ";")
+
+
+def connect_raw(path=DATABASE_PATH):
+    """Open a raw sqlite3 connection to the app database with the standard pragmas applied."""
+    import sqlite3
+    conn = sqlite3.connect(path)
+    apply_sqlite_pragmas(conn)
+    return conn
 
-DATABASE_URL = "sqlite:///./questionnaires.db"
 
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    apply_sqlite_pragmas(dbapi_conn)
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -302,6 +339,11 @@ class Question(Base):
     assessment = relationship("Assessment", back_populates="questions")
     question_bank_item = relationship("QuestionBankItem")
 
+    __table_args__ = (
+        # Partial index: only uncategorized rows, so backfill_question_categories is O(missing)
+        Index("ix_q_cat_empty", "id", sqlite_where=text("coalesce(category, '') = ''")),
+    )
+
 
 RESPONSE_STATUS_DRAFT = "DRAFT"
 RESPONSE_STATUS_SUBMITTED = "SUBMITTED"
@@ -543,6 +585,12 @@ class RiskStatement(Base):
 
     trigger_question = relationship("QuestionBankItem")
 
+    __table_args__ = (
+        # Category-level statements are unique; question-level ones may share text across answers
+        Index("uq_rs_cat_trig_text", "category", "trigger_condition", "finding_text",
+              unique=True, sqlite_where=text("trigger_question_id IS NULL")),
+    )
+
 
 # ---------------------------------------------------------------------------
 # Reminder system
@@ -690,7 +738,19 @@ def compute_expectation_status(expected_value, answer_choice, expected_values=No
 
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        # One sqlite_master read instead of create_all's PRAGMA table_info probe per table
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
+        missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+        if missing:
+            Base.metadata.create_all(bind=conn, tables=missing, checkfirst=False)
+
+
+def optimize_db():
+    """Run PRAGMA optimize so SQLite refreshes planner stats after bulk seeding/migrations."""
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA analysis_limit=1000"))  # approximate ANALYZE, bounded per index
+        conn.execute(text("PRAGMA optimize"))
 
 
 def seed_default_admin():
@@ -1074,46 +1134,68 @@ def seed_risk_statements():
          "Vendor must address AI governance gaps including data protection controls and customer configurability. Provide improvement plan within 60 days."),
     ]
     try:
-        existing = set()
-        for rs in db.query(RiskStatement).all():
-            existing.add((rs.category, rs.trigger_condition, rs.finding_text))
-
-        added = 0
-        for category, trigger, severity, finding, remediation in seed_data:
-            if (category, trigger, finding) not in existing:
-                db.add(RiskStatement(
-                    category=category,
-                    trigger_condition=trigger,
-                    severity=severity,
-                    finding_text=finding,
-                    remediation_text=remediation,
-                    is_active=True,
-                ))
-                added += 1
-        if added > 0:
-            db.commit()
+        # Fast path: once seeded, skip hydrating every statement into a set on each startup
+        count = db.query(func.count(RiskStatement.id)).scalar()
+        if count >= len(seed_data):
+            category, trigger, _severity, finding, _remediation = seed_data[-1]
+            if db.query(RiskStatement.id).filter_by(
+                category=category, trigger_condition=trigger, finding_text=finding
+            ).first():
+                return
+
+        # Let SQLite dedupe against uq_rs_cat_trig_text in one executemany instead of diffing in Python
+        now = datetime.utcnow()
+        db.execute(text(
+            "INSERT OR IGNORE INTO risk_statements "
+            "(category, trigger_condition, severity, finding_text, remediation_text, is_active, created_at) "
+            "SELECT :category, :trigger_condition, :severity, :finding_text, :remediation_text, 1, :created_at "
+            "WHERE NOT EXISTS (SELECT 1 FROM risk_statements WHERE category = :category "
+            "AND trigger_condition = :trigger_condition AND finding_text = :finding_text)"
+        ), [
+            {"category": category, "trigger_condition": trigger, "severity": severity,
+             "finding_text": finding, "remediation_text": remediation, "created_at": now}
+            for category, trigger, severity, finding, remediation in seed_data
+        ])
+        db.commit()
     finally:
         db.close()
 
 
+# Rows fetched per chunk by the streaming backfills, and pending updates per bulk flush
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _flush_pending_updates(db, model, pending):
+    """Write accumulated {"id": ..., col: ...} mappings in one executemany and reset the buffer."""
+    if not pending:
+        return 0
+    db.bulk_update_mappings(model, pending)
+    count = len(pending)
+    pending.clear()
+    return count
+
+
 def backfill_question_categories():
     """Backfill categories on assessment questions by matching text to question bank."""
     db = SessionLocal()
     try:
-        uncategorized = db.query(Question).filter(
-            (Question.category == None) | (Question.category == "")
-        ).all()
-        if not uncategorized:
-            return
-
-        bank_map = {item.text: item.category for item in db.query(QuestionBankItem).all()}
+        # Literal '' (not a bound param) so SQLite can match the ix_q_cat_empty partial index
+        uncategorized = db.query(Question.id, Question.question_text).filter(
+            func.coalesce(Question.category, literal_column("''")) == literal_column("''")
+        ).yield_per(BACKFILL_BATCH_SIZE)
 
+        bank_map = None
+        pending = []
         updated = 0
-        for q in uncategorized:
-            cat = bank_map.get(q.question_text)
+        for q_id, q_text in uncategorized:
+            if bank_map is None:
+                bank_map = dict(db.query(QuestionBankItem.text, QuestionBankItem.category).all())
+            cat = bank_map.get(q_text)
             if cat:
-                q.category = cat
-                updated += 1
+                pending.append({"id": q_id, "category": cat})
+                if len(pending) >= BACKFILL_BATCH_SIZE:
+                    updated += _flush_pending_updates(db, Question, pending)
+        updated += _flush_pending_updates(db, Question, pending)
 
         if updated > 0:
             db.commit()
@@ -1125,20 +1207,22 @@ def backfill_question_bank_item_ids():
     """Backfill question_bank_item_id on assessment questions by matching text to question bank."""
     db = SessionLocal()
     try:
-        unlinked = db.query(Question).filter(
+        unlinked = db.query(Question.id, Question.question_text).filter(
             Question.question_bank_item_id == None
-        ).all()
-        if not unlinked:
-            return
-
-        bank_map = {item.text: item.id for item in db.query(QuestionBankItem).all()}
+        ).yield_per(BACKFILL_BATCH_SIZE)
 
+        bank_map = None
+        pending = []
         updated = 0
-        for q in unlinked:
-            bank_id = bank_map.get(q.question_text)
+        for q_id, q_text in unlinked:
+            if bank_map is None:
+                bank_map = dict(db.query(QuestionBankItem.text, QuestionBankItem.id).all())
+            bank_id = bank_map.get(q_text)
             if bank_id:
-                q.question_bank_item_id = bank_id
-                updated += 1
+                pending.append({"id": q_id, "question_bank_item_id": bank_id})
+                if len(pending) >= BACKFILL_BATCH_SIZE:
+                    updated += _flush_pending_updates(db, Question, pending)
+        updated += _flush_pending_updates(db, Question, pending)
 
         if updated > 0:
             db.commit()
@@ -1146,34 +1230,48 @@ def backfill_question_bank_item_ids():
         db.close()
 
 
+# app.services.scoring imports models, so bind it here (after the names it needs are
+# defined) instead of per call. If models is being loaded because scoring was imported
+# first, the import fails and backfill_decision_scores binds it on first use.
+try:
+    from app.services.scoring import compute_assessment_scores
+except ImportError:
+    compute_assessment_scores = None
+
+
 def backfill_decision_scores():
     """Backfill overall_score on finalized decisions that don't have one yet."""
-    from app.services.scoring import compute_assessment_scores
+    global compute_assessment_scores
+    if compute_assessment_scores is None:
+        from app.services.scoring import compute_assessment_scores
 
     db = SessionLocal()
     try:
-        decisions = db.query(AssessmentDecision).filter(
+        decisions = db.query(AssessmentDecision.id, AssessmentDecision.assessment_id).filter(
             AssessmentDecision.status == DECISION_STATUS_FINAL,
             AssessmentDecision.overall_score == None
-        ).all()
-        if not decisions:
-            return
+        ).yield_per(BACKFILL_BATCH_SIZE)
 
+        pending = []
         updated = 0
-        for decision in decisions:
+        for decision_id, assessment_id in decisions:
             questions = db.query(Question).filter(
-                Question.assessment_id == decision.assessment_id
+                Question.assessment_id == assessment_id
             ).order_by(Question.order).all()
             response = db.query(Response).filter(
-                Response.assessment_id == decision.assessment_id,
+                Response.assessment_id == assessment_id,
                 Response.status == RESPONSE_STATUS_SUBMITTED
             ).order_by(Response.submitted_at.desc()).first()
 
             if questions and response:
                 scores = compute_assessment_scores(questions, response)
                 if scores.get("overall_score") is not None:
-                    decision.overall_score = int(scores["overall_score"])
-                    updated += 1
+                    pending.append({"id": decision_id, "overall_score": int(scores["overall_score"])})
+                    if len(pending) >= BACKFILL_BATCH_SIZE:
+                        updated += _flush_pending_updates(db, AssessmentDecision, pending)
+            # Drop the per-decision question/answer graph so memory stays bounded
+            db.expunge_all()
+        updated += _flush_pending_updates(db, AssessmentDecision, pending)
 
         if updated > 0:
             db.commit()
@@ -1181,69 +1279,6 @@ def backfill_decision_scores():
         db.close()
 
 
-def backfill_vendor_new_columns():
-    """Add new vendor columns to existing database using raw ALTER TABLE.
-    New tables (vendor_contacts, vendor_documents) are auto-created by init_db().
-    """
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-
-    new_columns = [
-        ("industry", "VARCHAR(100)"),
-        ("website", "VARCHAR(500)"),
-        ("headquarters", "VARCHAR(255)"),
-        ("service_type", "VARCHAR(50)"),
-        ("data_classification", "VARCHAR(50)"),
-        ("business_criticality", "VARCHAR(20)"),
-        ("access_level", "VARCHAR(50)"),
-        ("inherent_risk_tier", "VARCHAR(20)"),
-        ("tier_override", "VARCHAR(20)"),
-        ("tier_notes", "TEXT"),
-        ("contract_start_date", "DATETIME"),
-        ("contract_end_date", "DATETIME"),
-        ("contract_value", "VARCHAR(100)"),
-        ("auto_renewal", "BOOLEAN DEFAULT 0"),
-    ]
-
-    cursor.execute("PRAGMA table_info(vendors)")
-    existing = {row[1] for row in cursor.fetchall()}
-
-    for col_name, col_type in new_columns:
-        if col_name not in existing:
-            try:
-                cursor.execute(f"ALTER TABLE vendors ADD COLUMN {col_name} {col_type}")
-            except sqlite3.OperationalError:
-                pass
-
-    # Also backfill assessment_decisions table
-    cursor.execute("PRAGMA table_info(assessment_decisions)")
-    existing_decision_cols = {row[1] for row in cursor.fetchall()}
-    if "overall_score" not in existing_decision_cols:
-        try:
-            cursor.execute("ALTER TABLE assessment_decisions ADD COLUMN overall_score INTEGER")
-        except sqlite3.OperationalError:
-            pass
-
-    # Also backfill assessments table
-    cursor.execute("PRAGMA table_info(assessments)")
-    existing_assessment_cols = {row[1] for row in cursor.fetchall()}
-    if "previous_assessment_id" not in existing_assessment_cols:
-        try:
-            cursor.execute("ALTER TABLE assessments ADD COLUMN previous_assessment_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
-    for col_name, col_type in [("sent_to_email", "VARCHAR(255)"), ("expires_at", "DATETIME"), ("reminders_paused", "BOOLEAN DEFAULT 0"), ("first_reminder_days", "INTEGER"), ("reminder_frequency_days", "INTEGER"), ("max_reminders", "INTEGER")]:
-        if col_name not in existing_assessment_cols:
-            try:
-                cursor.execute(f"ALTER TABLE assessments ADD COLUMN {col_name} {col_type}")
-            except sqlite3.OperationalError:
-                pass
-
-    conn.commit()
-    conn.close()
-
-
 # ==================== VENDOR ACTIVITY TIMELINE ====================
 
 ACTIVITY_VENDOR_CREATED = "VENDOR_CREATED"
@@ -1346,7 +1381,7 @@ COMMENT_ENTITY_RISK = "risk"
 COMMENT_ENTITY_INCIDENT = "incident"
 COMMENT_ENTITY_ASSET = "asset"
 COMMENT_ENTITY_RISK_ASSESSMENT = "risk_assessment"
-VALID_COMMENT_ENTITIES = [COMMENT_ENTITY_VENDOR, COMMENT_ENTITY_ASSESSMENT, COMMENT_ENTITY_DECISION, COMMENT_ENTITY_REMEDIATION, COMMENT_ENTITY_CONTROL, COMMENT_ENTITY_CONTROL_IMPL, COMMENT_ENTITY_POLICY, COMMENT_ENTITY_RISK, COMMENT_ENTITY_INCIDENT, COMMENT_ENTITY_ASSET, COMMENT_ENTITY_RISK_ASSESSMENT]
+VALID_COMMENT_ENTITIES = frozenset({COMMENT_ENTITY_VENDOR, COMMENT_ENTITY_ASSESSMENT, COMMENT_ENTITY_DECISION, COMMENT_ENTITY_REMEDIATION, COMMENT_ENTITY_CONTROL, COMMENT_ENTITY_CONTROL_IMPL, COMMENT_ENTITY_POLICY, COMMENT_ENTITY_RISK, COMMENT_ENTITY_INCIDENT, COMMENT_ENTITY_ASSET, COMMENT_ENTITY_RISK_ASSESSMENT})
 
 
 class Comment(Base):
@@ -1398,7 +1433,7 @@ class TieringRule(Base):
     field = Column(String(50), nullable=False)  # data_classification, business_criticality, access_level
     value = Column(String(50), nullable=False)   # e.g. "Restricted", "Critical"
     tier = Column(String(20), nullable=False)     # "Tier 1", "Tier 2", "Tier 3"
-    priority = Column(Integer, default=0)         # lower = checked first
+    priority = Column(Integer, default=0, index=True)  # lower = checked first
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
@@ -1443,7 +1478,7 @@ class RiskSnapshot(Base):
 # ==================== VENDOR OFFBOARDING ====================
 
 VENDOR_STATUS_OFFBOARDING = "OFFBOARDING"
-VALID_VENDOR_STATUSES = [VENDOR_STATUS_ACTIVE, VENDOR_STATUS_ARCHIVED, VENDOR_STATUS_OFFBOARDING]
+VALID_VENDOR_STATUSES = frozenset({VENDOR_STATUS_ACTIVE, VENDOR_STATUS_ARCHIVED, VENDOR_STATUS_OFFBOARDING})
 
 
 # ==================== RISK EXCEPTION / WAIVER ====================
@@ -1452,7 +1487,8 @@ EXCEPTION_STATUS_PENDING = "PENDING"
 EXCEPTION_STATUS_APPROVED = "APPROVED"
 EXCEPTION_STATUS_REJECTED = "REJECTED"
 EXCEPTION_STATUS_EXPIRED = "EXPIRED"
-VALID_EXCEPTION_STATUSES = [EXCEPTION_STATUS_PENDING, EXCEPTION_STATUS_APPROVED, EXCEPTION_STATUS_REJECTED, EXCEPTION_STATUS_EXPIRED]
+VALID_EXCEPTION_STATUSES_ORDERED = (EXCEPTION_STATUS_PENDING, EXCEPTION_STATUS_APPROVED, EXCEPTION_STATUS_REJECTED, EXCEPTION_STATUS_EXPIRED)
+VALID_EXCEPTION_STATUSES = frozenset(VALID_EXCEPTION_STATUSES_ORDERED)
 
 ACTIVITY_EXCEPTION_CREATED = "EXCEPTION_CREATED"
 ACTIVITY_EXCEPTION_APPROVED = "EXCEPTION_APPROVED"
@@ -1491,9 +1527,10 @@ INTAKE_STATUS_PENDING = "PENDING"
 INTAKE_STATUS_APPROVED = "APPROVED"
 INTAKE_STATUS_REJECTED = "REJECTED"
 INTAKE_STATUS_CONVERTED = "CONVERTED"
-VALID_INTAKE_STATUSES = [INTAKE_STATUS_PENDING, INTAKE_STATUS_APPROVED, INTAKE_STATUS_REJECTED, INTAKE_STATUS_CONVERTED]
+VALID_INTAKE_STATUSES = frozenset({INTAKE_STATUS_PENDING, INTAKE_STATUS_APPROVED, INTAKE_STATUS_REJECTED, INTAKE_STATUS_CONVERTED})
 
-VALID_INTAKE_URGENCIES = ["LOW", "MEDIUM", "HIGH"]
+VALID_INTAKE_URGENCIES_ORDERED = ("LOW", "MEDIUM", "HIGH")
+VALID_INTAKE_URGENCIES = frozenset(VALID_INTAKE_URGENCIES_ORDERED)
 
 NOTIF_INTAKE_SUBMITTED = "INTAKE_SUBMITTED"
 NOTIF_INTAKE_APPROVED = "INTAKE_APPROVED"
@@ -1526,125 +1563,34 @@ class VendorIntakeRequest(Base):
     vendor = relationship("Vendor")
 
 
-def backfill_new_feature_columns():
-    """Add columns for offboarding, comments, scoring config, etc."""
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-
-    # Vendor: offboarding_checklist
-    cursor.execute("PRAGMA table_info(vendors)")
-    vendor_cols = {row[1] for row in cursor.fetchall()}
-    if "offboarding_checklist" not in vendor_cols:
-        try:
-            cursor.execute("ALTER TABLE vendors ADD COLUMN offboarding_checklist TEXT")
-        except sqlite3.OperationalError:
-            pass
-
-    conn.commit()
-    conn.close()
-
-
-def backfill_approval_columns():
-    """Add multi-approver columns to assessment_decisions."""
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(assessment_decisions)")
-    existing = {row[1] for row in cursor.fetchall()}
-    for col_name, col_type in [
-        ("requires_approval", "BOOLEAN DEFAULT 0"),
-        ("approval_status", "VARCHAR(20)"),
-        ("approved_by_id", "INTEGER"),
-        ("approval_notes", "TEXT"),
-        ("approved_at", "DATETIME"),
-    ]:
-        if col_name not in existing:
-            try:
-                cursor.execute(f"ALTER TABLE assessment_decisions ADD COLUMN {col_name} {col_type}")
-            except sqlite3.OperationalError:
-                pass
-
-    # framework_ref on question_bank_items
-    cursor.execute("PRAGMA table_info(question_bank_items)")
-    qbi_cols = {row[1] for row in cursor.fetchall()}
-    if "framework_ref" not in qbi_cols:
-        try:
-            cursor.execute("ALTER TABLE question_bank_items ADD COLUMN framework_ref VARCHAR(255)")
-        except sqlite3.OperationalError:
-            pass
-
-    conn.commit()
-    conn.close()
-
-
-def backfill_auth_columns():
-    """Add auth-related columns to existing tables."""
+def ensure_feature_indexes():
+    """Create/replace indexes for questions, tiering rules, risk statements and audit logs."""
     import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
+    conn = connect_raw()
     cursor = conn.cursor()
 
-    # Vendor: assigned_analyst_id
-    cursor.execute("PRAGMA table_info(vendors)")
-    vendor_cols = {row[1] for row in cursor.fetchall()}
-    if "assigned_analyst_id" not in vendor_cols:
-        try:
-            cursor.execute("ALTER TABLE vendors ADD COLUMN assigned_analyst_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
-
-    # VendorActivity: user_id
-    cursor.execute("PRAGMA table_info(vendor_activities)")
-    activity_cols = {row[1] for row in cursor.fetchall()}
-    if "user_id" not in activity_cols:
-        try:
-            cursor.execute("ALTER TABLE vendor_activities ADD COLUMN user_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
-
-    # AssessmentDecision: decided_by_id
-    cursor.execute("PRAGMA table_info(assessment_decisions)")
-    decision_cols = {row[1] for row in cursor.fetchall()}
-    if "decided_by_id" not in decision_cols:
-        try:
-            cursor.execute("ALTER TABLE assessment_decisions ADD COLUMN decided_by_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
-
-    # RemediationItem: assigned_to_user_id
-    cursor.execute("PRAGMA table_info(remediation_items)")
-    rem_cols = {row[1] for row in cursor.fetchall()}
-    if "assigned_to_user_id" not in rem_cols:
-        try:
-            cursor.execute("ALTER TABLE remediation_items ADD COLUMN assigned_to_user_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
+    # Question: partial index over uncategorized rows (see Question.__table_args__)
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_q_cat_empty ON questions(id) WHERE coalesce(category, '') = ''")
 
-    # Assessment: assigned_analyst_id
-    cursor.execute("PRAGMA table_info(assessments)")
-    assessment_cols = {row[1] for row in cursor.fetchall()}
-    if "assigned_analyst_id" not in assessment_cols:
-        try:
-            cursor.execute("ALTER TABLE assessments ADD COLUMN assigned_analyst_id INTEGER")
-        except sqlite3.OperationalError:
-            pass
+    # TieringRule: rules are always read ORDER BY priority
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_tiering_rules_priority ON tiering_rules(priority)")
 
-    conn.commit()
-    conn.close()
+    # RiskStatement: natural key for idempotent seeding (see RiskStatement.__table_args__)
+    try:
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_rs_cat_trig_text "
+            "ON risk_statements(category, trigger_condition, finding_text) WHERE trigger_question_id IS NULL"
+        )
+    except sqlite3.IntegrityError:
+        pass  # pre-existing duplicates; seed_risk_statements still dedupes via NOT EXISTS
 
+    # AuditLog: composite indexes replace the per-column ones (see AuditLog.__table_args__)
+    for old_index in ("ix_audit_logs_timestamp", "ix_audit_logs_action",
+                      "ix_audit_logs_entity_type", "ix_audit_logs_entity_id"):
+        cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_audit_entity_time ON audit_logs(entity_type, entity_id, timestamp)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_audit_action_time ON audit_logs(action, timestamp)")
 
-def backfill_template_columns():
-    """Add suggested_tier column to assessment_templates for existing DBs."""
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(assessment_templates)")
-    existing = {row[1] for row in cursor.fetchall()}
-    if "suggested_tier" not in existing:
-        try:
-            cursor.execute("ALTER TABLE assessment_templates ADD COLUMN suggested_tier VARCHAR(20)")
-        except sqlite3.OperationalError:
-            pass
     conn.commit()
     conn.close()
 
@@ -1652,8 +1598,9 @@ def backfill_template_columns():
 def seed_default_templates():
     """Create 3 seed templates from the question bank if no templates exist."""
     import secrets
-    db = SessionLocal()
-    try:
+    from itertools import groupby
+    # One explicit transaction for the whole seed: a single journal sync on commit
+    with SessionLocal.begin() as db:
         if db.query(AssessmentTemplate).count() > 0:
             return
 
@@ -1664,32 +1611,24 @@ def seed_default_templates():
         if not bank_items:
             return
 
-        # Group by category
-        categories = {}
-        for item in bank_items:
-            categories.setdefault(item.category, []).append(item)
+        # Group by category (the query is already ordered by category)
+        categories = {cat: list(items) for cat, items in groupby(bank_items, key=lambda i: i.category)}
+
+        # One timestamp for the whole seed batch
+        now = datetime.utcnow()
+
+        # One urandom read for all three 64-char template tokens
+        raw = secrets.token_bytes(96).hex()
+        t1_tok, t2_tok, t3_tok = raw[:64], raw[64:128], raw[128:192]
 
         # Tier 1: Comprehensive — all questions, HIGH weight
         t1 = AssessmentTemplate(
             name="Comprehensive Security Assessment",
             description="Full-depth assessment covering all security domains. Recommended for Tier 1 (Critical Risk) vendors with access to restricted data or critical business functions.",
-            token=secrets.token_hex(32),
+            token=t1_tok,
             suggested_tier="Tier 1",
+            created_at=now,
         )
-        db.add(t1)
-        db.flush()
-        order = 0
-        for cat, items in categories.items():
-            for item in items:
-                db.add(TemplateQuestion(
-                    template_id=t1.id,
-                    question_text=item.text,
-                    order=order,
-                    weight="HIGH",
-                    category=cat,
-                    answer_options=item.answer_options,
-                ))
-                order += 1
 
         # Tier 2: Standard — core categories, 2 per category, MEDIUM weight
         core_categories = [
@@ -1701,24 +1640,10 @@ def seed_default_templates():
         t2 = AssessmentTemplate(
             name="Standard Vendor Review",
             description="Balanced assessment covering core security domains. Recommended for Tier 2 (Elevated Risk) vendors.",
-            token=secrets.token_hex(32),
+            token=t2_tok,
             suggested_tier="Tier 2",
+            created_at=now,
         )
-        db.add(t2)
-        db.flush()
-        order = 0
-        for cat in core_categories:
-            items = categories.get(cat, [])
-            for item in items[:2]:
-                db.add(TemplateQuestion(
-                    template_id=t2.id,
-                    question_text=item.text,
-                    order=order,
-                    weight="MEDIUM",
-                    category=cat,
-                    answer_options=item.answer_options,
-                ))
-                order += 1
 
         # Tier 3: Lightweight — essential categories, 2 per category, LOW weight
         essential_categories = [
@@ -1728,28 +1653,35 @@ def seed_default_templates():
         t3 = AssessmentTemplate(
             name="Lightweight Vendor Screening",
             description="Quick screening covering essential security basics. Recommended for Tier 3 (Standard Risk) vendors.",
-            token=secrets.token_hex(32),
+            token=t3_tok,
             suggested_tier="Tier 3",
+            created_at=now,
         )
-        db.add(t3)
+
+        # The only flush: materialize template ids for the question foreign keys
+        db.add_all([t1, t2, t3])
         db.flush()
-        order = 0
-        for cat in essential_categories:
-            items = categories.get(cat, [])
-            for item in items[:2]:
-                db.add(TemplateQuestion(
-                    template_id=t3.id,
-                    question_text=item.text,
-                    order=order,
-                    weight="LOW",
-                    category=cat,
-                    answer_options=item.answer_options,
-                ))
-                order += 1
 
-        db.commit()
-    finally:
-        db.close()
+        # TemplateQuestion rows for all three tiers, written in one Core executemany
+        # (t1 takes every bank item in category order; t2/t3 take 2 per listed category)
+        tiers = [
+            (t1.id, "HIGH", bank_items),
+            (t2.id, "MEDIUM", [item for cat in core_categories for item in categories.get(cat, [])[:2]]),
+            (t3.id, "LOW", [item for cat in essential_categories for item in categories.get(cat, [])[:2]]),
+        ]
+        question_rows = [
+            {
+                "template_id": template_id,
+                "question_text": item.text,
+                "order": order,
+                "weight": weight,
+                "category": item.category,
+                "answer_options": item.answer_options,
+            }
+            for template_id, weight, items in tiers
+            for order, item in enumerate(items)
+        ]
+        db.execute(insert(TemplateQuestion.__table__), question_rows)
 
 
 # ==================== AUDIT LOG ====================
@@ -1782,26 +1714,139 @@ AUDIT_ENTITY_RISK_ASSESSMENT = "risk_assessment"
 AUDIT_ENTITY_RISK_INTAKE = "risk_intake"
 
 
+class VocabCode(TypeDecorator):
+    """Fixed-vocabulary string stored as its SmallInteger position in `vocabulary`.
+
+    Python-side values stay the string constants. Positions are persisted, so
+    vocabularies are append-only. Values outside the vocabulary pass through as-is.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, vocabulary):
+        super().__init__()
+        self.vocabulary = tuple(vocabulary)
+        self._codes = {value: code for code, value in enumerate(self.vocabulary)}
+
+    def process_bind_param(self, value, dialect):
+        return self._codes.get(value, value)
+
+    def process_result_value(self, value, dialect):
+        # Pre-existing VARCHAR columns keep TEXT affinity, so codes may read back as '0'
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if isinstance(value, int) and 0 <= value < len(self.vocabulary):
+            return self.vocabulary[value]
+        return value
+
+    def rewrite_sql(self, table, column):
+        """UPDATE that rewrites legacy string values of `table.column` to their codes.
+
+        Only rows still holding a vocabulary string match, so a migrated table writes nothing.
+        """
+        whens = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(self.vocabulary))
+        values = ", ".join(f"'{value}'" for value in self.vocabulary)
+        return (
+            f"UPDATE {table} SET {column} = CASE {column} {whens} END "
+            f"WHERE typeof({column}) = 'text' AND {column} IN ({values})"
+        )
+
+
+AUDIT_COMPRESS_MIN_LENGTH = 256
+
+
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed as a BLOB once it reaches AUDIT_COMPRESS_MIN_LENGTH.
+
+    Shorter values stay plain TEXT (compression would only grow them); reads accept both.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or len(value) < AUDIT_COMPRESS_MIN_LENGTH:
+            return value
+        return zlib.compress(value.encode("utf-8"))
+
+    def process_result_value(self, value, dialect):
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode("utf-8")
+        return value
+
+
 class AuditLog(Base):
     """Append-only audit trail for compliance."""
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Entity history is read as (entity_type, entity_id) ordered by time
+        Index("ix_audit_entity_time", "entity_type", "entity_id", "timestamp"),
+        Index("ix_audit_action_time", "action", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow)
     actor_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     actor_email = Column(String(255), nullable=True)
-    action = Column(String(50), nullable=False, index=True)
-    entity_type = Column(String(50), nullable=False, index=True)
-    entity_id = Column(Integer, nullable=True, index=True)
+    action = Column(String(50), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=True)
     entity_label = Column(String(500), nullable=True)
-    old_value = Column(Text, nullable=True)
-    new_value = Column(Text, nullable=True)
-    description = Column(Text, nullable=True)
+    old_value = Column(CompressedText, nullable=True)
+    new_value = Column(CompressedText, nullable=True)
+    description = Column(CompressedText, nullable=True)
     ip_address = Column(String(45), nullable=True)
+    # Tamper-evident chain: row_hash = sha256(prev_hash + canonical row JSON)
+    prev_hash = Column(String(64), nullable=True)
+    row_hash = Column(String(64), nullable=True, index=True)
 
     actor = relationship("User", foreign_keys=[actor_user_id])
 
 
+AUDIT_HASH_FIELDS = (
+    "timestamp", "actor_user_id", "actor_email", "action", "entity_type",
+    "entity_id", "entity_label", "old_value", "new_value", "description", "ip_address",
+)
+
+
+def compute_audit_row_hash(entry, prev_hash):
+    """Return the chain hash for an AuditLog row given the previous row's hash."""
+    fields = {}
+    for name in AUDIT_HASH_FIELDS:
+        value = getattr(entry, name)
+        fields[name] = value.isoformat() if isinstance(value, datetime) else value
+    payload = (prev_hash or "") + json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@event.listens_for(AuditLog, "before_insert")
+def _chain_audit_log(mapper, connection, target):
+    # All rows of one flush get before_insert before any is written, so the chain
+    # tip is read once from the DB and then carried in session.info for the flush.
+    session = object_session(target)
+    info = session.info if session is not None else {}
+    if "audit_chain_tip" not in info:
+        # Hold the write lock before reading the tip. pysqlite only opens its (deferred)
+        # transaction at the first DML, so two sessions flushing at once could otherwise read
+        # the same tip and fork the chain. An open transaction here has already written, so it
+        # holds the lock; otherwise start one with BEGIN IMMEDIATE (waits on busy_timeout).
+        if not connection.connection.dbapi_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        info["audit_chain_tip"] = connection.execute(
+            text("SELECT row_hash FROM audit_logs ORDER BY id DESC LIMIT 1")
+        ).scalar()
+    if target.timestamp is None:
+        target.timestamp = datetime.utcnow()
+    target.prev_hash = info["audit_chain_tip"]
+    target.row_hash = compute_audit_row_hash(target, target.prev_hash)
+    info["audit_chain_tip"] = target.row_hash
+
+
+@event.listens_for(SessionLocal, "after_flush_postexec")
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _reset_audit_chain_tip(session, *args):
+    session.info.pop("audit_chain_tip", None)
+
+
 # ==================== SLA CONFIGURATION ====================
 
 SLA_STATUS_ON_TRACK = "ON_TRACK"
@@ -1832,12 +1877,18 @@ NOTIF_SLA_WARNING = "SLA_WARNING"
 NOTIF_SLA_BREACH = "SLA_BREACH"
 
 # Add SLA activity icons/colors
-ACTIVITY_ICONS[ACTIVITY_SLA_WARNING] = "bi-clock-history"
-ACTIVITY_ICONS[ACTIVITY_SLA_BREACH] = "bi-exclamation-octagon-fill"
-ACTIVITY_COLORS[ACTIVITY_SLA_WARNING] = "#fd7e14"
-ACTIVITY_COLORS[ACTIVITY_SLA_BREACH] = "#dc3545"
-NOTIF_ICONS[NOTIF_SLA_WARNING] = "bi-clock-history"
-NOTIF_ICONS[NOTIF_SLA_BREACH] = "bi-exclamation-octagon-fill"
+ACTIVITY_ICONS.update({
+    ACTIVITY_SLA_WARNING: "bi-clock-history",
+    ACTIVITY_SLA_BREACH: "bi-exclamation-octagon-fill",
+})
+ACTIVITY_COLORS.update({
+    ACTIVITY_SLA_WARNING: "#fd7e14",
+    ACTIVITY_SLA_BREACH: "#dc3545",
+})
+NOTIF_ICONS.update({
+    NOTIF_SLA_WARNING: "bi-clock-history",
+    NOTIF_SLA_BREACH: "bi-exclamation-octagon-fill",
+})
 
 
 class SLAConfig(Base):
@@ -1855,60 +1906,26 @@ class SLAConfig(Base):
 
 def ensure_sla_configs(db_session):
     """Seed default SLA configs if none exist."""
-    existing = db_session.query(SLAConfig).count()
-    if existing > 0:
-        return db_session.query(SLAConfig).order_by(SLAConfig.tier).all()
-
-    defaults = [
-        ("Tier 1", 14, 7, 80),
-        ("Tier 2", 21, 14, 80),
-        ("Tier 3", 30, 21, 80),
-    ]
-    configs = []
-    for tier, resp_days, rev_days, warn_pct in defaults:
-        cfg = SLAConfig(
-            tier=tier,
-            response_deadline_days=resp_days,
-            review_deadline_days=rev_days,
-            warning_threshold_pct=warn_pct,
-            enabled=True,
-        )
-        db_session.add(cfg)
-        configs.append(cfg)
-    db_session.commit()
-    return configs
-
-
-def backfill_sla_columns():
-    """Add sla_enabled column to reminder_config for existing DBs."""
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(reminder_config)")
-    existing = {row[1] for row in cursor.fetchall()}
-    if "sla_enabled" not in existing:
-        try:
-            cursor.execute("ALTER TABLE reminder_config ADD COLUMN sla_enabled BOOLEAN DEFAULT 1")
-        except sqlite3.OperationalError:
-            pass
-    conn.commit()
-    conn.close()
-
-
-def backfill_onboarding_column():
-    """Add onboarding_dismissed column to users for existing DBs."""
-    import sqlite3
-    conn = sqlite3.connect("./questionnaires.db")
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(users)")
-    existing = {row[1] for row in cursor.fetchall()}
-    if "onboarding_dismissed" not in existing:
-        try:
-            cursor.execute("ALTER TABLE users ADD COLUMN onboarding_dismissed BOOLEAN DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
-    conn.commit()
-    conn.close()
+    if db_session.query(SLAConfig.id).first() is None:
+        defaults = [
+            ("Tier 1", 14, 7, 80),
+            ("Tier 2", 21, 14, 80),
+            ("Tier 3", 30, 21, 80),
+        ]
+        now = datetime.utcnow()
+        db_session.bulk_insert_mappings(SLAConfig, [
+            dict(
+                tier=tier,
+                response_deadline_days=resp_days,
+                review_deadline_days=rev_days,
+                warning_threshold_pct=warn_pct,
+                enabled=True,
+                updated_at=now,
+            )
+            for tier, resp_days, rev_days, warn_pct in defaults
+        ])
+        db_session.commit()
+    return db_session.query(SLAConfig).order_by(SLAConfig.tier).all()
 
 
 # ==================== CONTROLS MODULE ====================
@@ -1957,15 +1974,21 @@ CONTROL_FREQUENCY_LABELS = {
     CONTROL_FREQ_SEMI_ANNUAL: "Semi-Annual",
     CONTROL_FREQ_ANNUAL: "Annual",
 }
-CONTROL_FREQUENCY_DAYS = {
-    CONTROL_FREQ_CONTINUOUS: 1,
-    CONTROL_FREQ_DAILY: 1,
-    CONTROL_FREQ_WEEKLY: 7,
-    CONTROL_FREQ_MONTHLY: 30,
-    CONTROL_FREQ_QUARTERLY: 90,
-    CONTROL_FREQ_SEMI_ANNUAL: 182,
-    CONTROL_FREQ_ANNUAL: 365,
-}
+
+
+class ControlFreq(IntEnum):
+    """Integer form of the CONTROL_FREQ_* strings; indexes CONTROL_FREQUENCY_DAYS_BY_ENUM."""
+    CONTINUOUS = 0
+    DAILY = 1
+    WEEKLY = 2
+    MONTHLY = 3
+    QUARTERLY = 4
+    SEMI_ANNUAL = 5
+    ANNUAL = 6
+
+
+CONTROL_FREQUENCY_DAYS_BY_ENUM = (1, 1, 7, 30, 90, 182, 365)
+CONTROL_FREQUENCY_DAYS = {f.name: CONTROL_FREQUENCY_DAYS_BY_ENUM[f] for f in ControlFreq}
 
 VALID_CONTROL_DOMAINS = [
     "Access Control",
@@ -2113,11 +2136,11 @@ FINDING_STATUS_COLORS = {FINDING_STATUS_OPEN: "#dc3545", FINDING_STATUS_IN_PROGR
 
 # Activity / notification constants for controls
 ACTIVITY_CONTROL_IMPL_UPDATED = "CONTROL_IMPL_UPDATED"
-ACTIVITY_ICONS[ACTIVITY_CONTROL_IMPL_UPDATED] = "bi-shield-lock"
-ACTIVITY_COLORS[ACTIVITY_CONTROL_IMPL_UPDATED] = "#6f42c1"
-
 NOTIF_CONTROL_TEST_OVERDUE = "CONTROL_TEST_OVERDUE"
-NOTIF_ICONS[NOTIF_CONTROL_TEST_OVERDUE] = "bi-shield-exclamation"
+
+ACTIVITY_ICONS.update({ACTIVITY_CONTROL_IMPL_UPDATED: "bi-shield-lock"})
+ACTIVITY_COLORS.update({ACTIVITY_CONTROL_IMPL_UPDATED: "#6f42c1"})
+NOTIF_ICONS.update({NOTIF_CONTROL_TEST_OVERDUE: "bi-shield-exclamation"})
 
 
 class Control(Base):
@@ -2128,10 +2151,10 @@ class Control(Base):
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
     domain = Column(String(100), nullable=False, index=True)
-    control_type = Column(String(20), nullable=False, default=CONTROL_TYPE_PREVENTIVE)
-    implementation_type = Column(String(20), nullable=False, default=CONTROL_IMPL_MANUAL)
-    test_frequency = Column(String(20), nullable=False, default=CONTROL_FREQ_ANNUAL)
-    criticality = Column(String(20), nullable=False, default="MEDIUM")
+    control_type = Column(VocabCode(VALID_CONTROL_TYPES), nullable=False, default=CONTROL_TYPE_PREVENTIVE)
+    implementation_type = Column(VocabCode(VALID_CONTROL_IMPL_TYPES), nullable=False, default=CONTROL_IMPL_MANUAL)
+    test_frequency = Column(VocabCode(VALID_CONTROL_FREQUENCIES), nullable=False, default=CONTROL_FREQ_ANNUAL)
+    criticality = Column(VocabCode(VALID_CONTROL_CRITICALITIES), nullable=False, default="MEDIUM")
     owner_role = Column(String(100), nullable=True)
     owner_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     objective = Column(Text, nullable=True)
@@ -2149,9 +2172,19 @@ class Control(Base):
     implementations = relationship("ControlImplementation", back_populates="control", cascade="all, delete-orphan")
     owner = relationship("User", foreign_keys=[owner_user_id])
 
+    @property
+    def test_frequency_days(self):
+        """Required days between tests; unknown frequencies fall back to annual."""
+        return CONTROL_FREQUENCY_DAYS.get(self.test_frequency, 365)
+
 
 class ControlFrameworkMapping(Base):
     __tablename__ = "control_framework_mappings"
+    __table_args__ = (
+        Index("ix_cfm_control_fw", "control_id", "framework"),
+        # (framework, reference) lookups: adoption sync, requirement coverage
+        Index("ix_cfm_fw_ref", "framework", "reference"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
@@ -2163,6 +2196,9 @@ class ControlFrameworkMapping(Base):
 
 class ControlQuestionMapping(Base):
     __tablename__ = "control_question_mappings"
+    __table_args__ = (
+        Index("ix_cqm_control", "control_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
@@ -2174,6 +2210,9 @@ class ControlQuestionMapping(Base):
 
 class ControlRiskMapping(Base):
     __tablename__ = "control_risk_mappings"
+    __table_args__ = (
+        Index("ix_crm_control", "control_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
@@ -2185,6 +2224,9 @@ class ControlRiskMapping(Base):
 
 class ControlImplementation(Base):
     __tablename__ = "control_implementations"
+    __table_args__ = (
+        Index("ix_ci_control_vendor", "control_id", "vendor_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
@@ -2206,6 +2248,9 @@ class ControlImplementation(Base):
 
 class ControlTest(Base):
     __tablename__ = "control_tests"
+    __table_args__ = (
+        Index("ix_ct_impl_testdate", "implementation_id", "test_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     implementation_id = Column(Integer, ForeignKey("control_implementations.id"), nullable=False)
@@ -2242,6 +2287,10 @@ class ControlTest(Base):
 
 class ControlEvidence(Base):
     __tablename__ = "control_evidence"
+    __table_args__ = (
+        Index("ix_ce_impl", "implementation_id"),
+        Index("ix_ce_test", "test_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     test_id = Column(Integer, ForeignKey("control_tests.id"), nullable=True)
@@ -2252,14 +2301,35 @@ class ControlEvidence(Base):
     size_bytes = Column(Integer, nullable=True)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     implementation_id = Column(Integer, ForeignKey("control_implementations.id"), nullable=True)
-    framework_tags = Column(Text, nullable=True)  # JSON list of framework keys this evidence satisfies
 
     test = relationship("ControlTest", back_populates="evidence_files")
     implementation = relationship("ControlImplementation", foreign_keys=[implementation_id])
+    framework_tag_links = relationship("ControlEvidenceFrameworkTag", back_populates="evidence", cascade="all, delete-orphan")
+
+    @property
+    def framework_tags(self):
+        """Framework keys this evidence satisfies."""
+        return [link.framework for link in self.framework_tag_links]
+
+
+class ControlEvidenceFrameworkTag(Base):
+    __tablename__ = "control_evidence_framework_tags"
+    __table_args__ = (
+        Index("ix_cef_tags_framework_evidence", "framework", "evidence_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    evidence_id = Column(Integer, ForeignKey("control_evidence.id"), nullable=False)
+    framework = Column(String(50), nullable=False)
+
+    evidence = relationship("ControlEvidence", back_populates="framework_tag_links")
 
 
 class ControlFinding(Base):
     __tablename__ = "control_findings"
+    __table_args__ = (
+        Index("ix_cf_test_status", "control_test_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_test_id = Column(Integer, ForeignKey("control_tests.id"), nullable=False)
@@ -2306,6 +2376,9 @@ ATTESTATION_STATUS_COLORS = {
 
 class ControlAttestation(Base):
     __tablename__ = "control_attestations"
+    __table_args__ = (
+        Index("ix_ca_impl", "implementation_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     implementation_id = Column(Integer, ForeignKey("control_implementations.id"), nullable=False)
@@ -2328,6 +2401,9 @@ class ControlAttestation(Base):
 class ControlHealthSnapshot(Base):
     """Point-in-time health score snapshot for trend analysis."""
     __tablename__ = "control_health_snapshots"
+    __table_args__ = (
+        Index("ix_chs_impl_date", "implementation_id", "snapshot_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     implementation_id = Column(Integer, ForeignKey("control_implementations.id"), nullable=False)
@@ -2343,517 +2419,509 @@ class ControlHealthSnapshot(Base):
     implementation = relationship("ControlImplementation", backref="health_snapshots")
 
 
-def backfill_controls_tables():
-    """Migrate controls + control_tests tables: add new columns."""
-    migrations = [
-        ("control_tests", "status", "ALTER TABLE control_tests ADD COLUMN status VARCHAR(20) DEFAULT 'COMPLETED' NOT NULL"),
-        ("control_tests", "scheduled_date", "ALTER TABLE control_tests ADD COLUMN scheduled_date DATETIME"),
-        ("controls", "owner_user_id", "ALTER TABLE controls ADD COLUMN owner_user_id INTEGER"),
-        ("controls", "objective", "ALTER TABLE controls ADD COLUMN objective TEXT"),
-        ("controls", "procedure", "ALTER TABLE controls ADD COLUMN procedure TEXT"),
-        ("controls", "operation_frequency", "ALTER TABLE controls ADD COLUMN operation_frequency VARCHAR(20)"),
-        # Enhanced testing workpaper columns
-        ("control_tests", "test_period_start", "ALTER TABLE control_tests ADD COLUMN test_period_start DATETIME"),
-        ("control_tests", "test_period_end", "ALTER TABLE control_tests ADD COLUMN test_period_end DATETIME"),
-        ("control_tests", "sample_size", "ALTER TABLE control_tests ADD COLUMN sample_size INTEGER"),
-        ("control_tests", "population_size", "ALTER TABLE control_tests ADD COLUMN population_size INTEGER"),
-        ("control_tests", "exceptions_count", "ALTER TABLE control_tests ADD COLUMN exceptions_count INTEGER DEFAULT 0"),
-        ("control_tests", "exception_details", "ALTER TABLE control_tests ADD COLUMN exception_details TEXT"),
-        ("control_tests", "conclusion", "ALTER TABLE control_tests ADD COLUMN conclusion TEXT"),
-        ("control_tests", "finding_risk_rating", "ALTER TABLE control_tests ADD COLUMN finding_risk_rating VARCHAR(20)"),
-        ("control_tests", "reviewer_user_id", "ALTER TABLE control_tests ADD COLUMN reviewer_user_id INTEGER"),
-        ("control_tests", "review_date", "ALTER TABLE control_tests ADD COLUMN review_date DATETIME"),
-        ("control_tests", "review_notes", "ALTER TABLE control_tests ADD COLUMN review_notes TEXT"),
-        # Roll-forward testing columns
-        ("control_tests", "is_roll_forward", "ALTER TABLE control_tests ADD COLUMN is_roll_forward BOOLEAN DEFAULT 0"),
-        ("control_tests", "parent_test_id", "ALTER TABLE control_tests ADD COLUMN parent_test_id INTEGER"),
-        # Control-level test/evidence instruction columns
-        ("controls", "default_test_procedure", "ALTER TABLE controls ADD COLUMN default_test_procedure TEXT"),
-        ("controls", "evidence_instructions", "ALTER TABLE controls ADD COLUMN evidence_instructions TEXT"),
-        # Evidence as first-class entity columns
-        ("control_evidence", "implementation_id", "ALTER TABLE control_evidence ADD COLUMN implementation_id INTEGER"),
-        ("control_evidence", "framework_tags", "ALTER TABLE control_evidence ADD COLUMN framework_tags TEXT"),
-    ]
-    for table, col, sql in migrations:
-        db = SessionLocal()
-        try:
-            existing = {r[1] for r in db.execute(text(f"PRAGMA table_info({table})")).fetchall()}
-            if col not in existing:
-                db.execute(text(sql))
-                db.commit()
-        except Exception:
-            db.rollback()
-        finally:
-            db.close()
+# (table, column, DDL) for columns added after a table first shipped; applied by run_backfills
+SCHEMA_MIGRATIONS = [
+    # Vendor profile, contract, ownership and offboarding columns
+    ("vendors", "industry", "ALTER TABLE vendors ADD COLUMN industry VARCHAR(100)"),
+    ("vendors", "website", "ALTER TABLE vendors ADD COLUMN website VARCHAR(500)"),
+    ("vendors", "headquarters", "ALTER TABLE vendors ADD COLUMN headquarters VARCHAR(255)"),
+    ("vendors", "service_type", "ALTER TABLE vendors ADD COLUMN service_type VARCHAR(50)"),
+    ("vendors", "data_classification", "ALTER TABLE vendors ADD COLUMN data_classification VARCHAR(50)"),
+    ("vendors", "business_criticality", "ALTER TABLE vendors ADD COLUMN business_criticality VARCHAR(20)"),
+    ("vendors", "access_level", "ALTER TABLE vendors ADD COLUMN access_level VARCHAR(50)"),
+    ("vendors", "inherent_risk_tier", "ALTER TABLE vendors ADD COLUMN inherent_risk_tier VARCHAR(20)"),
+    ("vendors", "tier_override", "ALTER TABLE vendors ADD COLUMN tier_override VARCHAR(20)"),
+    ("vendors", "tier_notes", "ALTER TABLE vendors ADD COLUMN tier_notes TEXT"),
+    ("vendors", "contract_start_date", "ALTER TABLE vendors ADD COLUMN contract_start_date DATETIME"),
+    ("vendors", "contract_end_date", "ALTER TABLE vendors ADD COLUMN contract_end_date DATETIME"),
+    ("vendors", "contract_value", "ALTER TABLE vendors ADD COLUMN contract_value VARCHAR(100)"),
+    ("vendors", "auto_renewal", "ALTER TABLE vendors ADD COLUMN auto_renewal BOOLEAN DEFAULT 0"),
+    ("vendors", "assigned_analyst_id", "ALTER TABLE vendors ADD COLUMN assigned_analyst_id INTEGER"),
+    ("vendors", "offboarding_checklist", "ALTER TABLE vendors ADD COLUMN offboarding_checklist TEXT"),
+    # Decision scoring, ownership and multi-approver columns
+    ("assessment_decisions", "overall_score", "ALTER TABLE assessment_decisions ADD COLUMN overall_score INTEGER"),
+    ("assessment_decisions", "decided_by_id", "ALTER TABLE assessment_decisions ADD COLUMN decided_by_id INTEGER"),
+    ("assessment_decisions", "requires_approval", "ALTER TABLE assessment_decisions ADD COLUMN requires_approval BOOLEAN DEFAULT 0"),
+    ("assessment_decisions", "approval_status", "ALTER TABLE assessment_decisions ADD COLUMN approval_status VARCHAR(20)"),
+    ("assessment_decisions", "approved_by_id", "ALTER TABLE assessment_decisions ADD COLUMN approved_by_id INTEGER"),
+    ("assessment_decisions", "approval_notes", "ALTER TABLE assessment_decisions ADD COLUMN approval_notes TEXT"),
+    ("assessment_decisions", "approved_at", "ALTER TABLE assessment_decisions ADD COLUMN approved_at DATETIME"),
+    # Assessment lineage, delivery, reminder and ownership columns
+    ("assessments", "previous_assessment_id", "ALTER TABLE assessments ADD COLUMN previous_assessment_id INTEGER"),
+    ("assessments", "sent_to_email", "ALTER TABLE assessments ADD COLUMN sent_to_email VARCHAR(255)"),
+    ("assessments", "expires_at", "ALTER TABLE assessments ADD COLUMN expires_at DATETIME"),
+    ("assessments", "reminders_paused", "ALTER TABLE assessments ADD COLUMN reminders_paused BOOLEAN DEFAULT 0"),
+    ("assessments", "first_reminder_days", "ALTER TABLE assessments ADD COLUMN first_reminder_days INTEGER"),
+    ("assessments", "reminder_frequency_days", "ALTER TABLE assessments ADD COLUMN reminder_frequency_days INTEGER"),
+    ("assessments", "max_reminders", "ALTER TABLE assessments ADD COLUMN max_reminders INTEGER"),
+    ("assessments", "assigned_analyst_id", "ALTER TABLE assessments ADD COLUMN assigned_analyst_id INTEGER"),
+    # Template / question bank / activity / remediation ownership columns
+    ("assessment_templates", "suggested_tier", "ALTER TABLE assessment_templates ADD COLUMN suggested_tier VARCHAR(20)"),
+    ("question_bank_items", "framework_ref", "ALTER TABLE question_bank_items ADD COLUMN framework_ref VARCHAR(255)"),
+    ("vendor_activities", "user_id", "ALTER TABLE vendor_activities ADD COLUMN user_id INTEGER"),
+    ("remediation_items", "assigned_to_user_id", "ALTER TABLE remediation_items ADD COLUMN assigned_to_user_id INTEGER"),
+    ("reminder_config", "sla_enabled", "ALTER TABLE reminder_config ADD COLUMN sla_enabled BOOLEAN DEFAULT 1"),
+    ("users", "onboarding_dismissed", "ALTER TABLE users ADD COLUMN onboarding_dismissed BOOLEAN DEFAULT 0"),
+    # Controls module
+    ("control_tests", "status", "ALTER TABLE control_tests ADD COLUMN status VARCHAR(20) DEFAULT 'COMPLETED' NOT NULL"),
+    ("control_tests", "scheduled_date", "ALTER TABLE control_tests ADD COLUMN scheduled_date DATETIME"),
+    ("controls", "owner_user_id", "ALTER TABLE controls ADD COLUMN owner_user_id INTEGER"),
+    ("controls", "objective", "ALTER TABLE controls ADD COLUMN objective TEXT"),
+    ("controls", "procedure", "ALTER TABLE controls ADD COLUMN procedure TEXT"),
+    ("controls", "operation_frequency", "ALTER TABLE controls ADD COLUMN operation_frequency VARCHAR(20)"),
+    # Enhanced testing workpaper columns
+    ("control_tests", "test_period_start", "ALTER TABLE control_tests ADD COLUMN test_period_start DATETIME"),
+    ("control_tests", "test_period_end", "ALTER TABLE control_tests ADD COLUMN test_period_end DATETIME"),
+    ("control_tests", "sample_size", "ALTER TABLE control_tests ADD COLUMN sample_size INTEGER"),
+    ("control_tests", "population_size", "ALTER TABLE control_tests ADD COLUMN population_size INTEGER"),
+    ("control_tests", "exceptions_count", "ALTER TABLE control_tests ADD COLUMN exceptions_count INTEGER DEFAULT 0"),
+    ("control_tests", "exception_details", "ALTER TABLE control_tests ADD COLUMN exception_details TEXT"),
+    ("control_tests", "conclusion", "ALTER TABLE control_tests ADD COLUMN conclusion TEXT"),
+    ("control_tests", "finding_risk_rating", "ALTER TABLE control_tests ADD COLUMN finding_risk_rating VARCHAR(20)"),
+    ("control_tests", "reviewer_user_id", "ALTER TABLE control_tests ADD COLUMN reviewer_user_id INTEGER"),
+    ("control_tests", "review_date", "ALTER TABLE control_tests ADD COLUMN review_date DATETIME"),
+    ("control_tests", "review_notes", "ALTER TABLE control_tests ADD COLUMN review_notes TEXT"),
+    # Roll-forward testing columns
+    ("control_tests", "is_roll_forward", "ALTER TABLE control_tests ADD COLUMN is_roll_forward BOOLEAN DEFAULT 0"),
+    ("control_tests", "parent_test_id", "ALTER TABLE control_tests ADD COLUMN parent_test_id INTEGER"),
+    # Control-level test/evidence instruction columns
+    ("controls", "default_test_procedure", "ALTER TABLE controls ADD COLUMN default_test_procedure TEXT"),
+    ("controls", "evidence_instructions", "ALTER TABLE controls ADD COLUMN evidence_instructions TEXT"),
+    # Evidence as first-class entity columns
+    ("control_evidence", "implementation_id", "ALTER TABLE control_evidence ADD COLUMN implementation_id INTEGER"),
+    # Audit hash chain
+    ("audit_logs", "prev_hash", "ALTER TABLE audit_logs ADD COLUMN prev_hash VARCHAR(64)"),
+    ("audit_logs", "row_hash", "ALTER TABLE audit_logs ADD COLUMN row_hash VARCHAR(64)"),
+]
 
-    # Rebuild control_evidence to make test_id nullable (Feature 7: evidence decoupled from tests)
-    db = SessionLocal()
+# Indexes over columns added by SCHEMA_MIGRATIONS, created once those columns exist
+SCHEMA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_audit_logs_row_hash ON audit_logs(row_hash)",
+]
+
+
+# Compiled PRAGMA table_info clauses, keyed by table name (a small closed set)
+_PRAGMA_TABLE_INFO = {}
+
+
+def _pragma_table_info(table):
+    """Return a cached `PRAGMA table_info(<table>)` TextClause for Session/Connection.execute."""
+    clause = _PRAGMA_TABLE_INFO.get(table)
+    if clause is None:
+        clause = _PRAGMA_TABLE_INFO[table] = text(f"PRAGMA table_info({table})")
+    return clause
+
+
+def _ensure_column(cursor, existing_columns, column, ddl):
+    """Run `ddl` (an ALTER TABLE ... ADD COLUMN) if `column` is not in the cached column set."""
+    import sqlite3
+    if column in existing_columns:
+        return
     try:
-        cols = {r[1]: r[3] for r in db.execute(text("PRAGMA table_info(control_evidence)")).fetchall()}
-        if cols.get("test_id") == 1:  # notnull == 1 means NOT NULL, need to fix
-            db.execute(text("""
-                CREATE TABLE IF NOT EXISTS control_evidence_new (
-                    id INTEGER PRIMARY KEY,
-                    test_id INTEGER,
-                    original_filename VARCHAR(255) NOT NULL,
-                    stored_filename VARCHAR(255) NOT NULL,
-                    stored_path VARCHAR(512) NOT NULL,
-                    content_type VARCHAR(100),
-                    size_bytes INTEGER,
-                    uploaded_at DATETIME,
-                    implementation_id INTEGER,
-                    framework_tags TEXT,
-                    FOREIGN KEY(test_id) REFERENCES control_tests(id),
-                    FOREIGN KEY(implementation_id) REFERENCES control_implementations(id)
-                )
-            """))
-            db.execute(text("""
-                INSERT INTO control_evidence_new
-                SELECT id, test_id, original_filename, stored_filename, stored_path,
-                       content_type, size_bytes, uploaded_at, implementation_id, framework_tags
-                FROM control_evidence
-            """))
-            db.execute(text("DROP TABLE control_evidence"))
-            db.execute(text("ALTER TABLE control_evidence_new RENAME TO control_evidence"))
-            db.commit()
+        cursor.execute(ddl)
+    except sqlite3.OperationalError:
+        pass
+    existing_columns.add(column)
+
+
+def _schema_fingerprint(conn):
+    """SQLite's schema_version cookie plus a digest of the migration list.
+
+    schema_version changes on any DDL, so a match means no schema drift since the
+    last successful run_backfills and no new entries in SCHEMA_MIGRATIONS/SCHEMA_INDEXES.
+    """
+    digest = hashlib.sha256(repr((SCHEMA_MIGRATIONS, SCHEMA_INDEXES)).encode("utf-8")).hexdigest()[:16]
+    return f"{conn.execute('PRAGMA schema_version').fetchone()[0]}:{digest}"
+
+
+def run_backfills(path=DATABASE_PATH):
+    """Apply SCHEMA_MIGRATIONS on one connection inside a single transaction.
+
+    Skipped entirely when the stored schema fingerprint matches (see _schema_fingerprint).
+    """
+    import sqlite3
+    conn = connect_raw(path)
+    conn.isolation_level = None  # explicit BEGIN/COMMIT below
+    conn.row_factory = sqlite3.Row
+    try:
+        try:
+            stored = conn.execute("SELECT fingerprint FROM schema_state WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            stored = None  # first run: schema_state not created yet
+        if stored is not None and stored["fingerprint"] == _schema_fingerprint(conn):
+            return
+
+        # One PRAGMA table_info per distinct table, then O(1) set lookups per migration
+        existing = {
+            table: {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for table in {m[0] for m in SCHEMA_MIGRATIONS}
+        }
+        needed = [ddl for table, column, ddl in SCHEMA_MIGRATIONS if column not in existing[table]]
+        try:
+            # Fast path: every pending ALTER plus the indexes in one script / one transaction.
+            # IMMEDIATE takes the write lock up front (waiting on busy_timeout) instead of
+            # failing with SQLITE_BUSY when the first ALTER tries to upgrade a read lock.
+            conn.executescript("BEGIN IMMEDIATE;\n" + ";\n".join(needed + SCHEMA_INDEXES) + ";\nCOMMIT;")
+        except sqlite3.OperationalError:
+            # A statement failed (e.g. a column added concurrently); redo one by one, skipping failures
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            for table, column, ddl in SCHEMA_MIGRATIONS:
+                _ensure_column(cursor, existing[table], column, ddl)
+            for ddl in SCHEMA_INDEXES:
+                cursor.execute(ddl)
+            cursor.execute("COMMIT")
+
+        conn.execute("CREATE TABLE IF NOT EXISTS schema_state (id INTEGER PRIMARY KEY, fingerprint TEXT)")
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_state (id, fingerprint) VALUES (1, ?)", (_schema_fingerprint(conn),)
+        )
     except Exception:
-        db.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
     finally:
-        db.close()
+        conn.close()
 
 
-def seed_default_controls():
-    """Seed 35 controls across 12 domains, each mapped to SOC 2 + ISO 27001 + NIST CSF 2.0."""
-    db = SessionLocal()
+# schema_state row recording that the one-time audit payload compression has finished
+AUDIT_COMPRESSION_STATE_ID = 2
+AUDIT_COMPRESSION_DONE = "audit_payload_compression:done"
+
+
+def backfill_audit_payload_compression(batch_size=2000, path=DATABASE_PATH):
+    """Compress legacy plain-TEXT audit payloads that are long enough for CompressedText.
+
+    CompressedText compresses every row it writes, so only rows from before it existed can
+    match; completion is recorded in schema_state and later startups skip the scan.
+    """
+    conn = connect_raw(path)
     try:
-        if db.query(Control).count() > 0:
+        conn.execute("CREATE TABLE IF NOT EXISTS schema_state (id INTEGER PRIMARY KEY, fingerprint TEXT)")
+        done = conn.execute(
+            "SELECT 1 FROM schema_state WHERE id = ? AND fingerprint = ?",
+            (AUDIT_COMPRESSION_STATE_ID, AUDIT_COMPRESSION_DONE),
+        ).fetchone()
+        if done:
             return
 
-        seed_data = [
-            # Access Control
-            ("CTL-AC-001", "User Access Reviews", "Periodic review of user access rights to ensure appropriateness.",
-             "Access Control", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_QUARTERLY, "HIGH",
-             [("SOC_2", "CC6.1"), ("ISO_27001", "A.9.2.5"), ("NIST_CSF_2", "PR.AC-1")]),
-            ("CTL-AC-002", "Multi-Factor Authentication", "MFA enforced for all privileged and remote access.",
-             "Access Control", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "CRITICAL",
-             [("SOC_2", "CC6.1"), ("ISO_27001", "A.9.4.2"), ("NIST_CSF_2", "PR.AC-7")]),
-            ("CTL-AC-003", "Least Privilege Enforcement", "Users granted minimum access necessary for their role.",
-             "Access Control", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "HIGH",
-             [("SOC_2", "CC6.3"), ("ISO_27001", "A.9.1.2"), ("NIST_CSF_2", "PR.AC-4")]),
-
-            # Cryptography
-            ("CTL-CR-001", "Data Encryption at Rest", "All sensitive data encrypted at rest using AES-256 or equivalent.",
-             "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "CRITICAL",
-             [("SOC_2", "CC6.7"), ("ISO_27001", "A.10.1.1"), ("NIST_CSF_2", "PR.DS-1")]),
-            ("CTL-CR-002", "Data Encryption in Transit", "All data in transit encrypted using TLS 1.2+.",
-             "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "CRITICAL",
-             [("SOC_2", "CC6.7"), ("ISO_27001", "A.10.1.1"), ("NIST_CSF_2", "PR.DS-2")]),
-            ("CTL-CR-003", "Encryption Key Management", "Formal key management lifecycle including rotation and revocation.",
-             "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC6.1"), ("ISO_27001", "A.10.1.2"), ("NIST_CSF_2", "PR.DS-1")]),
-
-            # Incident Management
-            ("CTL-IR-001", "Incident Response Plan", "Documented IRP with roles, escalation paths, and notification timelines.",
-             "Incident Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "CRITICAL",
-             [("SOC_2", "CC7.3"), ("ISO_27001", "A.16.1.1"), ("NIST_CSF_2", "RS.RP-1")]),
-            ("CTL-IR-002", "Incident Detection & Alerting", "Automated detection and alerting for security incidents.",
-             "Incident Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC7.2"), ("ISO_27001", "A.16.1.2"), ("NIST_CSF_2", "DE.AE-5")]),
-            ("CTL-IR-003", "Post-Incident Review", "Formal lessons-learned process after security incidents.",
-             "Incident Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "MEDIUM",
-             [("SOC_2", "CC7.5"), ("ISO_27001", "A.16.1.6"), ("NIST_CSF_2", "RS.IM-1")]),
-
-            # Vulnerability Management
-            ("CTL-VM-001", "Vulnerability Scanning", "Regular automated vulnerability scans of all production systems.",
-             "Vulnerability Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_MONTHLY, "HIGH",
-             [("SOC_2", "CC7.1"), ("ISO_27001", "A.12.6.1"), ("NIST_CSF_2", "DE.CM-8")]),
-            ("CTL-VM-002", "Penetration Testing", "Annual third-party penetration testing of critical systems.",
-             "Vulnerability Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC4.1"), ("ISO_27001", "A.18.2.3"), ("NIST_CSF_2", "DE.CM-8")]),
-            ("CTL-VM-003", "Patch Management", "Timely patching of systems based on criticality and risk severity.",
-             "Vulnerability Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_MONTHLY, "CRITICAL",
-             [("SOC_2", "CC7.1"), ("ISO_27001", "A.12.6.1"), ("NIST_CSF_2", "PR.IP-12")]),
-
-            # Business Continuity
-            ("CTL-BC-001", "Business Continuity Plan", "Documented BCP covering critical business functions.",
-             "Business Continuity", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "A1.2"), ("ISO_27001", "A.17.1.1"), ("NIST_CSF_2", "RC.RP-1")]),
-            ("CTL-BC-002", "Disaster Recovery Testing", "Regular DR testing with documented results and RTO/RPO validation.",
-             "Business Continuity", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "A1.3"), ("ISO_27001", "A.17.1.3"), ("NIST_CSF_2", "RC.RP-1")]),
-            ("CTL-BC-003", "Backup & Recovery", "Encrypted backups with geographic separation and regular restoration tests.",
-             "Business Continuity", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_MONTHLY, "CRITICAL",
-             [("SOC_2", "A1.2"), ("ISO_27001", "A.12.3.1"), ("NIST_CSF_2", "PR.IP-4")]),
-
-            # Governance
-            ("CTL-GV-001", "Security Policy Framework", "Documented and published security policies aligned to standards.",
-             "Governance", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC1.1"), ("ISO_27001", "A.5.1.1"), ("NIST_CSF_2", "GV.PO-1")]),
-            ("CTL-GV-002", "Risk Assessment Program", "Regular risk assessments aligned with recognized frameworks.",
-             "Governance", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC3.2"), ("ISO_27001", "A.8.2.1"), ("NIST_CSF_2", "ID.RA-1")]),
-            ("CTL-GV-003", "Security Awareness Training", "Annual security awareness training for all personnel.",
-             "Governance", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "MEDIUM",
-             [("SOC_2", "CC1.4"), ("ISO_27001", "A.7.2.2"), ("NIST_CSF_2", "PR.AT-1")]),
-
-            # Data Protection
-            ("CTL-DP-001", "Data Classification", "Formal data classification scheme with handling requirements.",
-             "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC6.5"), ("ISO_27001", "A.8.2.1"), ("NIST_CSF_2", "ID.AM-5")]),
-            ("CTL-DP-002", "Data Loss Prevention", "DLP controls to prevent unauthorized data exfiltration.",
-             "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC6.7"), ("ISO_27001", "A.13.2.1"), ("NIST_CSF_2", "PR.DS-5")]),
-            ("CTL-DP-003", "Data Retention & Disposal", "Formal data retention schedule and secure disposal procedures.",
-             "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "MEDIUM",
-             [("SOC_2", "CC6.5"), ("ISO_27001", "A.8.3.2"), ("NIST_CSF_2", "PR.IP-6")]),
-
-            # Security Monitoring
-            ("CTL-SM-001", "SIEM / Log Aggregation", "Centralized security event logging and correlation.",
-             "Security Monitoring", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC7.2"), ("ISO_27001", "A.12.4.1"), ("NIST_CSF_2", "DE.AE-3")]),
-            ("CTL-SM-002", "Audit Log Integrity", "Tamper-evident audit logs with restricted access.",
-             "Security Monitoring", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC7.2"), ("ISO_27001", "A.12.4.2"), ("NIST_CSF_2", "PR.PT-1")]),
-
-            # Network Security
-            ("CTL-NS-001", "Network Segmentation", "Production networks segmented from corporate and development.",
-             "Network Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC6.6"), ("ISO_27001", "A.13.1.3"), ("NIST_CSF_2", "PR.AC-5")]),
-            ("CTL-NS-002", "Firewall Management", "Firewall rules reviewed and documented with change control.",
-             "Network Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "HIGH",
-             [("SOC_2", "CC6.6"), ("ISO_27001", "A.13.1.1"), ("NIST_CSF_2", "PR.PT-4")]),
-
-            # Change Management
-            ("CTL-CM-001", "Change Management Process", "Formal change control process for production environments.",
-             "Change Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC8.1"), ("ISO_27001", "A.12.1.2"), ("NIST_CSF_2", "PR.IP-3")]),
-            ("CTL-CM-002", "Configuration Baseline", "Documented configuration baselines for critical systems.",
-             "Change Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
-             [("SOC_2", "CC8.1"), ("ISO_27001", "A.12.1.1"), ("NIST_CSF_2", "PR.IP-1")]),
-
-            # Third-Party Management
-            ("CTL-TP-001", "Third-Party Risk Assessment", "Formal vendor risk assessment for all third-party providers.",
-             "Third-Party Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
-             [("SOC_2", "CC9.2"), ("ISO_27001", "A.15.1.1"), ("NIST_CSF_2", "ID.SC-1")]),
-            ("CTL-TP-002", "Vendor Contract Security Requirements", "Security requirements embedded in vendor contracts.",
-             "Third-Party Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "MEDIUM",
-             [("SOC_2", "CC9.2"), ("ISO_27001", "A.15.1.2"), ("NIST_CSF_2", "ID.SC-3")]),
-
-            # Physical Security
-            ("CTL-PS-001", "Physical Access Controls", "Badge access and visitor management for secure areas.",
-             "Physical Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
-             [("SOC_2", "CC6.4"), ("ISO_27001", "A.11.1.2"), ("NIST_CSF_2", "PR.AC-2")]),
-            ("CTL-PS-002", "Environmental Controls", "Fire suppression, HVAC, and power redundancy for data centers.",
-             "Physical Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "MEDIUM",
-             [("SOC_2", "A1.1"), ("ISO_27001", "A.11.1.4"), ("NIST_CSF_2", "PR.IP-5")]),
-
-            # Secure Development
-            ("CTL-SD-001", "Secure SDLC", "Security integrated into all phases of the development lifecycle.",
-             "Secure Development", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC8.1"), ("ISO_27001", "A.14.2.1"), ("NIST_CSF_2", "PR.IP-2")]),
-            ("CTL-SD-002", "Code Review & Static Analysis", "Mandatory code reviews and SAST before production deployment.",
-             "Secure Development", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC8.1"), ("ISO_27001", "A.14.2.5"), ("NIST_CSF_2", "PR.IP-2")]),
-
-            # Asset Management
-            ("CTL-AM-001", "Asset Inventory", "Comprehensive hardware and software asset inventory maintained.",
-             "Asset Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
-             [("SOC_2", "CC6.1"), ("ISO_27001", "A.8.1.1"), ("NIST_CSF_2", "ID.AM-1")]),
-            ("CTL-AM-002", "Endpoint Protection", "Antivirus/EDR deployed on all endpoints with central management.",
-             "Asset Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
-             [("SOC_2", "CC6.8"), ("ISO_27001", "A.12.2.1"), ("NIST_CSF_2", "DE.CM-4")]),
-        ]
+        columns = ("old_value", "new_value", "description")
+        needs = " OR ".join(
+            f"(typeof({c}) = 'text' AND length({c}) >= {AUDIT_COMPRESS_MIN_LENGTH})" for c in columns
+        )
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f"SELECT id, {', '.join(columns)} FROM audit_logs WHERE id > ? AND ({needs}) ORDER BY id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                f"UPDATE audit_logs SET {', '.join(c + ' = ?' for c in columns)} WHERE id = ?",
+                [
+                    tuple(
+                        zlib.compress(v.encode("utf-8"))
+                        if isinstance(v, str) and len(v) >= AUDIT_COMPRESS_MIN_LENGTH else v
+                        for v in values
+                    ) + (row_id,)
+                    for row_id, *values in rows
+                ],
+            )
+            conn.commit()
+            last_id = rows[-1][0]
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_state (id, fingerprint) VALUES (?, ?)",
+            (AUDIT_COMPRESSION_STATE_ID, AUDIT_COMPRESSION_DONE),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
 
-        for ref, title, desc, domain, ctype, itype, freq, crit, mappings in seed_data:
-            ctrl = Control(
+def backfill_controls_tables():
+    """Rebuild control_evidence for the nullable test_id change and the framework_tags split,
+    then create the controls indexes (new columns are added by run_backfills)."""
+    # Rebuild control_evidence to make test_id nullable (Feature 7: evidence decoupled from tests)
+    # and to drop the legacy framework_tags JSON column (now control_evidence_framework_tags)
+    import sqlite3
+    conn = connect_raw()
+    conn.isolation_level = None  # the script below manages its own transaction
+    try:
+        # Only the two columns the rebuild depends on, via the table-valued pragma
+        test_id_notnull, has_framework_tags = conn.execute(
+            "SELECT coalesce(max(name = 'test_id' AND \"notnull\" = 1), 0), coalesce(max(name = 'framework_tags'), 0) "
+            "FROM pragma_table_info('control_evidence') WHERE name IN ('test_id', 'framework_tags')"
+        ).fetchone()
+        if test_id_notnull or has_framework_tags:  # NOT NULL test_id or legacy JSON column, need to fix
+            copy_tags = """
+                INSERT INTO control_evidence_framework_tags (evidence_id, framework)
+                SELECT DISTINCT ce.id, j.value
+                FROM control_evidence ce, json_each(ce.framework_tags) j
+                WHERE json_valid(ce.framework_tags) AND json_type(ce.framework_tags) = 'array'
+                  AND j.type = 'text';
+            """ if has_framework_tags else ""
+            if not test_id_notnull and sqlite3.sqlite_version_info >= (3, 35, 0):
+                # Only the JSON column has to go: SQLite's native DROP COLUMN rewrites the table
+                # in place and keeps the ix_ce_* indexes, no copy through a second table
+                rebuild = "ALTER TABLE control_evidence DROP COLUMN framework_tags;"
+            else:
+                # Explicit column list (not SELECT * / CTAS) keeps the PK/FKs and tolerates
+                # legacy column order
+                rebuild = """
+                    CREATE TABLE IF NOT EXISTS control_evidence_new (
+                        id INTEGER PRIMARY KEY,
+                        test_id INTEGER,
+                        original_filename VARCHAR(255) NOT NULL,
+                        stored_filename VARCHAR(255) NOT NULL,
+                        stored_path VARCHAR(512) NOT NULL,
+                        content_type VARCHAR(100),
+                        size_bytes INTEGER,
+                        uploaded_at DATETIME,
+                        implementation_id INTEGER,
+                        FOREIGN KEY(test_id) REFERENCES control_tests(id),
+                        FOREIGN KEY(implementation_id) REFERENCES control_implementations(id)
+                    );
+                    INSERT INTO control_evidence_new
+                    SELECT id, test_id, original_filename, stored_filename, stored_path,
+                           content_type, size_bytes, uploaded_at, implementation_id
+                    FROM control_evidence;
+                    DROP TABLE control_evidence;
+                    ALTER TABLE control_evidence_new RENAME TO control_evidence;
+                """
+            # One parse, one transaction: tag copy + column drop / table rebuild
+            conn.executescript(f"BEGIN IMMEDIATE;\n{copy_tags}\n{rebuild}\nCOMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+    finally:
+        conn.close()
+
+    with engine.begin() as conn:
+        # FK indexes declared in the controls __table_args__ (also restores ix_ce_* after the rebuild above);
+        # one sqlite_master read instead of a checkfirst probe per index
+        existing_indexes = {r[0] for r in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+        for model in (ControlFrameworkMapping, ControlQuestionMapping, ControlRiskMapping,
+                      ControlImplementation, ControlTest, ControlEvidence, ControlFinding,
+                      ControlAttestation, ControlHealthSnapshot):
+            for index in model.__table__.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=conn)
+
+        # Rewrite legacy string values of the coded Control columns (see VocabCode); only
+        # not-yet-migrated rows match, so steady-state startups write nothing
+        for column in ("control_type", "implementation_type", "test_frequency", "criticality"):
+            conn.execute(text(Control.__table__.c[column].type.rewrite_sql("controls", column)))
+
+
+# Built once at import; read by seed_default_controls / update_control_enrichments
+_CONTROL_SEED_DATA = (
+    # Access Control
+    ("CTL-AC-001", "User Access Reviews", "Periodic review of user access rights to ensure appropriateness.",
+     "Access Control", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_QUARTERLY, "HIGH",
+     (("SOC_2", "CC6.1"), ("ISO_27001", "A.9.2.5"), ("NIST_CSF_2", "PR.AC-1"))),
+    ("CTL-AC-002", "Multi-Factor Authentication", "MFA enforced for all privileged and remote access.",
+     "Access Control", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "CRITICAL",
+     (("SOC_2", "CC6.1"), ("ISO_27001", "A.9.4.2"), ("NIST_CSF_2", "PR.AC-7"))),
+    ("CTL-AC-003", "Least Privilege Enforcement", "Users granted minimum access necessary for their role.",
+     "Access Control", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "HIGH",
+     (("SOC_2", "CC6.3"), ("ISO_27001", "A.9.1.2"), ("NIST_CSF_2", "PR.AC-4"))),
+
+    # Cryptography
+    ("CTL-CR-001", "Data Encryption at Rest", "All sensitive data encrypted at rest using AES-256 or equivalent.",
+     "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "CRITICAL",
+     (("SOC_2", "CC6.7"), ("ISO_27001", "A.10.1.1"), ("NIST_CSF_2", "PR.DS-1"))),
+    ("CTL-CR-002", "Data Encryption in Transit", "All data in transit encrypted using TLS 1.2+.",
+     "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "CRITICAL",
+     (("SOC_2", "CC6.7"), ("ISO_27001", "A.10.1.1"), ("NIST_CSF_2", "PR.DS-2"))),
+    ("CTL-CR-003", "Encryption Key Management", "Formal key management lifecycle including rotation and revocation.",
+     "Cryptography", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC6.1"), ("ISO_27001", "A.10.1.2"), ("NIST_CSF_2", "PR.DS-1"))),
+
+    # Incident Management
+    ("CTL-IR-001", "Incident Response Plan", "Documented IRP with roles, escalation paths, and notification timelines.",
+     "Incident Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "CRITICAL",
+     (("SOC_2", "CC7.3"), ("ISO_27001", "A.16.1.1"), ("NIST_CSF_2", "RS.RP-1"))),
+    ("CTL-IR-002", "Incident Detection & Alerting", "Automated detection and alerting for security incidents.",
+     "Incident Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC7.2"), ("ISO_27001", "A.16.1.2"), ("NIST_CSF_2", "DE.AE-5"))),
+    ("CTL-IR-003", "Post-Incident Review", "Formal lessons-learned process after security incidents.",
+     "Incident Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "MEDIUM",
+     (("SOC_2", "CC7.5"), ("ISO_27001", "A.16.1.6"), ("NIST_CSF_2", "RS.IM-1"))),
+
+    # Vulnerability Management
+    ("CTL-VM-001", "Vulnerability Scanning", "Regular automated vulnerability scans of all production systems.",
+     "Vulnerability Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_MONTHLY, "HIGH",
+     (("SOC_2", "CC7.1"), ("ISO_27001", "A.12.6.1"), ("NIST_CSF_2", "DE.CM-8"))),
+    ("CTL-VM-002", "Penetration Testing", "Annual third-party penetration testing of critical systems.",
+     "Vulnerability Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC4.1"), ("ISO_27001", "A.18.2.3"), ("NIST_CSF_2", "DE.CM-8"))),
+    ("CTL-VM-003", "Patch Management", "Timely patching of systems based on criticality and risk severity.",
+     "Vulnerability Management", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_MONTHLY, "CRITICAL",
+     (("SOC_2", "CC7.1"), ("ISO_27001", "A.12.6.1"), ("NIST_CSF_2", "PR.IP-12"))),
+
+    # Business Continuity
+    ("CTL-BC-001", "Business Continuity Plan", "Documented BCP covering critical business functions.",
+     "Business Continuity", CONTROL_TYPE_CORRECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "A1.2"), ("ISO_27001", "A.17.1.1"), ("NIST_CSF_2", "RC.RP-1"))),
+    ("CTL-BC-002", "Disaster Recovery Testing", "Regular DR testing with documented results and RTO/RPO validation.",
+     "Business Continuity", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "A1.3"), ("ISO_27001", "A.17.1.3"), ("NIST_CSF_2", "RC.RP-1"))),
+    ("CTL-BC-003", "Backup & Recovery", "Encrypted backups with geographic separation and regular restoration tests.",
+     "Business Continuity", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_MONTHLY, "CRITICAL",
+     (("SOC_2", "A1.2"), ("ISO_27001", "A.12.3.1"), ("NIST_CSF_2", "PR.IP-4"))),
+
+    # Governance
+    ("CTL-GV-001", "Security Policy Framework", "Documented and published security policies aligned to standards.",
+     "Governance", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC1.1"), ("ISO_27001", "A.5.1.1"), ("NIST_CSF_2", "GV.PO-1"))),
+    ("CTL-GV-002", "Risk Assessment Program", "Regular risk assessments aligned with recognized frameworks.",
+     "Governance", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC3.2"), ("ISO_27001", "A.8.2.1"), ("NIST_CSF_2", "ID.RA-1"))),
+    ("CTL-GV-003", "Security Awareness Training", "Annual security awareness training for all personnel.",
+     "Governance", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "MEDIUM",
+     (("SOC_2", "CC1.4"), ("ISO_27001", "A.7.2.2"), ("NIST_CSF_2", "PR.AT-1"))),
+
+    # Data Protection
+    ("CTL-DP-001", "Data Classification", "Formal data classification scheme with handling requirements.",
+     "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC6.5"), ("ISO_27001", "A.8.2.1"), ("NIST_CSF_2", "ID.AM-5"))),
+    ("CTL-DP-002", "Data Loss Prevention", "DLP controls to prevent unauthorized data exfiltration.",
+     "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC6.7"), ("ISO_27001", "A.13.2.1"), ("NIST_CSF_2", "PR.DS-5"))),
+    ("CTL-DP-003", "Data Retention & Disposal", "Formal data retention schedule and secure disposal procedures.",
+     "Data Protection", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_ANNUAL, "MEDIUM",
+     (("SOC_2", "CC6.5"), ("ISO_27001", "A.8.3.2"), ("NIST_CSF_2", "PR.IP-6"))),
+
+    # Security Monitoring
+    ("CTL-SM-001", "SIEM / Log Aggregation", "Centralized security event logging and correlation.",
+     "Security Monitoring", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC7.2"), ("ISO_27001", "A.12.4.1"), ("NIST_CSF_2", "DE.AE-3"))),
+    ("CTL-SM-002", "Audit Log Integrity", "Tamper-evident audit logs with restricted access.",
+     "Security Monitoring", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC7.2"), ("ISO_27001", "A.12.4.2"), ("NIST_CSF_2", "PR.PT-1"))),
+
+    # Network Security
+    ("CTL-NS-001", "Network Segmentation", "Production networks segmented from corporate and development.",
+     "Network Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC6.6"), ("ISO_27001", "A.13.1.3"), ("NIST_CSF_2", "PR.AC-5"))),
+    ("CTL-NS-002", "Firewall Management", "Firewall rules reviewed and documented with change control.",
+     "Network Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "HIGH",
+     (("SOC_2", "CC6.6"), ("ISO_27001", "A.13.1.1"), ("NIST_CSF_2", "PR.PT-4"))),
+
+    # Change Management
+    ("CTL-CM-001", "Change Management Process", "Formal change control process for production environments.",
+     "Change Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC8.1"), ("ISO_27001", "A.12.1.2"), ("NIST_CSF_2", "PR.IP-3"))),
+    ("CTL-CM-002", "Configuration Baseline", "Documented configuration baselines for critical systems.",
+     "Change Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
+     (("SOC_2", "CC8.1"), ("ISO_27001", "A.12.1.1"), ("NIST_CSF_2", "PR.IP-1"))),
+
+    # Third-Party Management
+    ("CTL-TP-001", "Third-Party Risk Assessment", "Formal vendor risk assessment for all third-party providers.",
+     "Third-Party Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "HIGH",
+     (("SOC_2", "CC9.2"), ("ISO_27001", "A.15.1.1"), ("NIST_CSF_2", "ID.SC-1"))),
+    ("CTL-TP-002", "Vendor Contract Security Requirements", "Security requirements embedded in vendor contracts.",
+     "Third-Party Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_MANUAL, CONTROL_FREQ_ANNUAL, "MEDIUM",
+     (("SOC_2", "CC9.2"), ("ISO_27001", "A.15.1.2"), ("NIST_CSF_2", "ID.SC-3"))),
+
+    # Physical Security
+    ("CTL-PS-001", "Physical Access Controls", "Badge access and visitor management for secure areas.",
+     "Physical Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
+     (("SOC_2", "CC6.4"), ("ISO_27001", "A.11.1.2"), ("NIST_CSF_2", "PR.AC-2"))),
+    ("CTL-PS-002", "Environmental Controls", "Fire suppression, HVAC, and power redundancy for data centers.",
+     "Physical Security", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_ANNUAL, "MEDIUM",
+     (("SOC_2", "A1.1"), ("ISO_27001", "A.11.1.4"), ("NIST_CSF_2", "PR.IP-5"))),
+
+    # Secure Development
+    ("CTL-SD-001", "Secure SDLC", "Security integrated into all phases of the development lifecycle.",
+     "Secure Development", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC8.1"), ("ISO_27001", "A.14.2.1"), ("NIST_CSF_2", "PR.IP-2"))),
+    ("CTL-SD-002", "Code Review & Static Analysis", "Mandatory code reviews and SAST before production deployment.",
+     "Secure Development", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC8.1"), ("ISO_27001", "A.14.2.5"), ("NIST_CSF_2", "PR.IP-2"))),
+
+    # Asset Management
+    ("CTL-AM-001", "Asset Inventory", "Comprehensive hardware and software asset inventory maintained.",
+     "Asset Management", CONTROL_TYPE_DETECTIVE, CONTROL_IMPL_HYBRID, CONTROL_FREQ_QUARTERLY, "MEDIUM",
+     (("SOC_2", "CC6.1"), ("ISO_27001", "A.8.1.1"), ("NIST_CSF_2", "ID.AM-1"))),
+    ("CTL-AM-002", "Endpoint Protection", "Antivirus/EDR deployed on all endpoints with central management.",
+     "Asset Management", CONTROL_TYPE_PREVENTIVE, CONTROL_IMPL_AUTOMATED, CONTROL_FREQ_CONTINUOUS, "HIGH",
+     (("SOC_2", "CC6.8"), ("ISO_27001", "A.12.2.1"), ("NIST_CSF_2", "DE.CM-4"))),
+)
+
+
+def seed_default_controls(db):
+    """Seed 35 controls across 12 domains, each mapped to SOC 2 + ISO 27001 + NIST CSF 2.0."""
+    from app.services.control_seeds import CONTROL_ENRICHMENTS, CONTROL_REF_UPDATES, NO_ENRICHMENT
+
+    # Only seed an empty table, so controls a user deleted are not brought back on restart
+    if db.query(Control.id).first() is not None:
+        return
+
+    # One INSERT OR IGNORE ... RETURNING for the controls: a concurrent startup that seeded
+    # first is skipped via the unique control_ref instead of raising IntegrityError, and the
+    # returned ids replace a follow-up lookup. Enrichment fields and 2022/2.0 references are
+    # written up front, so update_control_enrichments has nothing left to rewrite.
+    enrichment_fields = ("objective", "procedure", "default_test_procedure")
+    now = datetime.utcnow()
+    id_by_ref = dict(db.execute(
+        insert(Control.__table__).prefix_with("OR IGNORE").values([
+            dict(
                 control_ref=ref, title=title, description=desc,
                 domain=domain, control_type=ctype, implementation_type=itype,
                 test_frequency=freq, criticality=crit, is_active=True,
+                created_at=now, updated_at=now,
+                **{f: CONTROL_ENRICHMENTS.get(ref, NO_ENRICHMENT).get(f) for f in enrichment_fields},
             )
-            db.add(ctrl)
-            db.flush()
-            for fw, reference in mappings:
-                db.add(ControlFrameworkMapping(
-                    control_id=ctrl.id, framework=fw, reference=reference,
-                ))
-
-        db.commit()
-    finally:
-        db.close()
+            for ref, title, desc, domain, ctype, itype, freq, crit, _ in _CONTROL_SEED_DATA
+        ]).returning(Control.__table__.c.control_ref, Control.__table__.c.id)
+    ).all())
+    if id_by_ref:
+        db.execute(insert(ControlFrameworkMapping.__table__), [
+            dict(
+                control_id=id_by_ref[ref], framework=fw,
+                reference=CONTROL_REF_UPDATES.get((fw, reference), reference),
+            )
+            for ref, *_, mappings in _CONTROL_SEED_DATA if ref in id_by_ref
+            for fw, reference in mappings
+        ])
 
 
-def update_control_enrichments():
+def update_control_enrichments(db):
     """Backfill objective, procedure, default_test_procedure on existing controls.
-    Also updates framework mapping references from 2013/1.1 numbering to 2022/2.0."""
-    db = SessionLocal()
-    try:
-        # Enrichment data keyed by control_ref
-        enrichments = {
-            "CTL-AC-001": {
-                "objective": "Ensure user access rights remain appropriate and aligned with job responsibilities.",
-                "procedure": "Review all user accounts quarterly; validate access levels with managers; remove stale accounts.",
-                "default_test_procedure": "Select sample of users; confirm access matches current role; verify terminated users removed.",
-            },
-            "CTL-AC-002": {
-                "objective": "Prevent unauthorized access through strong multi-factor authentication.",
-                "procedure": "Enforce MFA for all privileged and remote access; monitor MFA enrollment compliance.",
-                "default_test_procedure": "Attempt login without MFA; verify enforcement on privileged accounts; check enrollment rates.",
-            },
-            "CTL-AC-003": {
-                "objective": "Limit access to the minimum necessary for each role.",
-                "procedure": "Define role-based access profiles; review and adjust permissions quarterly.",
-                "default_test_procedure": "Compare user permissions to role definitions; identify over-provisioned accounts.",
-            },
-            "CTL-CR-001": {
-                "objective": "Protect sensitive data at rest from unauthorized disclosure.",
-                "procedure": "Encrypt all databases and storage volumes using AES-256; verify encryption status monthly.",
-                "default_test_procedure": "Verify encryption enabled on all production databases and storage; check key strength.",
-            },
-            "CTL-CR-002": {
-                "objective": "Protect data in transit from interception or tampering.",
-                "procedure": "Enforce TLS 1.2+ on all endpoints; disable weak cipher suites; scan for plaintext transmissions.",
-                "default_test_procedure": "Scan endpoints for TLS configuration; verify no plaintext data channels exist.",
-            },
-            "CTL-CR-003": {
-                "objective": "Ensure cryptographic keys are managed securely throughout their lifecycle.",
-                "procedure": "Use HSM or KMS for key storage; rotate keys per schedule; revoke compromised keys immediately.",
-                "default_test_procedure": "Review key rotation logs; verify key storage in HSM/KMS; check revocation procedures.",
-            },
-            "CTL-IR-001": {
-                "objective": "Ensure the organization can respond effectively to security incidents.",
-                "procedure": "Maintain documented IRP; conduct tabletop exercises annually; update after incidents.",
-                "default_test_procedure": "Review IRP document currency; verify annual tabletop exercise; check post-incident updates.",
-            },
-            "CTL-IR-002": {
-                "objective": "Detect security incidents promptly through automated monitoring.",
-                "procedure": "Configure SIEM alerts for critical events; tune detection rules; review alert volume weekly.",
-                "default_test_procedure": "Inject test events; verify alerts fire within SLA; review false positive rates.",
-            },
-            "CTL-IR-003": {
-                "objective": "Learn from incidents to prevent recurrence.",
-                "procedure": "Conduct post-incident review within 5 business days; document lessons learned; track remediation actions.",
-                "default_test_procedure": "Review post-incident reports; verify action items completed; check trend analysis.",
-            },
-            "CTL-VM-001": {
-                "objective": "Identify vulnerabilities in production systems before exploitation.",
-                "procedure": "Run authenticated vulnerability scans monthly; prioritize by CVSS score; track remediation.",
-                "default_test_procedure": "Review scan coverage and frequency; verify critical findings remediated within SLA.",
-            },
-            "CTL-VM-002": {
-                "objective": "Validate security controls through independent adversarial testing.",
-                "procedure": "Engage third-party penetration testers annually; scope all critical systems; remediate findings.",
-                "default_test_procedure": "Review pentest report; verify scope coverage; confirm critical findings remediated.",
-            },
-            "CTL-VM-003": {
-                "objective": "Maintain systems at current patch levels to reduce attack surface.",
-                "procedure": "Apply critical patches within 72 hours; high within 30 days; standard within 90 days.",
-                "default_test_procedure": "Sample systems for patch currency; verify patching SLAs met; check exception approvals.",
-            },
-            "CTL-BC-001": {
-                "objective": "Ensure critical business functions can continue during disruption.",
-                "procedure": "Maintain BCP covering all critical functions; review annually; update after organizational changes.",
-                "default_test_procedure": "Review BCP document; verify coverage of critical functions; check review dates.",
-            },
-            "CTL-BC-002": {
-                "objective": "Validate disaster recovery capabilities meet RTO/RPO targets.",
-                "procedure": "Conduct DR test annually; measure actual RTO/RPO; document results and gaps.",
-                "default_test_procedure": "Review DR test results; compare actual vs target RTO/RPO; verify gap remediation.",
-            },
-            "CTL-BC-003": {
-                "objective": "Ensure data can be recovered from backups when needed.",
-                "procedure": "Perform encrypted backups with geographic separation; test restoration monthly.",
-                "default_test_procedure": "Verify backup completion logs; perform test restoration; check geographic separation.",
-            },
-            "CTL-GV-001": {
-                "objective": "Establish security governance through documented policies.",
-                "procedure": "Publish security policies; obtain management approval; communicate to all personnel annually.",
-                "default_test_procedure": "Review policy documents; verify management approval signatures; check acknowledgment records.",
-            },
-            "CTL-GV-002": {
-                "objective": "Understand organizational risk through formal assessment.",
-                "procedure": "Conduct risk assessment annually; align with recognized framework; report to management.",
-                "default_test_procedure": "Review risk assessment report; verify methodology alignment; check management review.",
-            },
-            "CTL-GV-003": {
-                "objective": "Build security awareness across the organization.",
-                "procedure": "Deliver annual security awareness training; track completion; conduct phishing simulations.",
-                "default_test_procedure": "Review training completion rates; verify content currency; check phishing simulation results.",
-            },
-            "CTL-DP-001": {
-                "objective": "Classify data appropriately to apply correct handling controls.",
-                "procedure": "Maintain data classification scheme; label all data repositories; review classifications annually.",
-                "default_test_procedure": "Review classification scheme; sample repositories for correct labeling; verify handling procedures.",
-            },
-            "CTL-DP-002": {
-                "objective": "Prevent unauthorized data exfiltration.",
-                "procedure": "Deploy DLP on endpoints and network egress; configure policies for sensitive data patterns; review alerts.",
-                "default_test_procedure": "Test DLP detection with sample sensitive data; review alert logs; verify policy coverage.",
-            },
-            "CTL-DP-003": {
-                "objective": "Ensure data is retained appropriately and disposed of securely.",
-                "procedure": "Maintain retention schedule; automate retention enforcement; use secure disposal for expired data.",
-                "default_test_procedure": "Review retention schedule; verify automated enforcement; check secure disposal certificates.",
-            },
-            "CTL-SM-001": {
-                "objective": "Provide centralized security event visibility and correlation.",
-                "procedure": "Aggregate logs from all critical systems; configure correlation rules; review dashboards daily.",
-                "default_test_procedure": "Verify log source coverage; test correlation rules; review analyst response times.",
-            },
-            "CTL-SM-002": {
-                "objective": "Ensure audit logs cannot be tampered with.",
-                "procedure": "Write logs to immutable storage; restrict access to log infrastructure; monitor for gaps.",
-                "default_test_procedure": "Verify immutable storage configuration; test access restrictions; check for log gaps.",
-            },
-            "CTL-NS-001": {
-                "objective": "Reduce lateral movement risk through network segmentation.",
-                "procedure": "Segment production from corporate and development; maintain network diagrams; review annually.",
-                "default_test_procedure": "Review network diagrams; test segmentation boundaries; verify firewall rules enforce separation.",
-            },
-            "CTL-NS-002": {
-                "objective": "Maintain secure and documented firewall configurations.",
-                "procedure": "Review firewall rules quarterly; remove unused rules; document change justifications.",
-                "default_test_procedure": "Review firewall rule sets; verify quarterly review evidence; check for overly permissive rules.",
-            },
-            "CTL-CM-001": {
-                "objective": "Prevent unauthorized changes to production environments.",
-                "procedure": "Require change requests with approval; test in staging; maintain rollback plans.",
-                "default_test_procedure": "Review change records; verify approval workflow; check for unauthorized changes.",
-            },
-            "CTL-CM-002": {
-                "objective": "Maintain known-good configuration baselines.",
-                "procedure": "Document baselines for critical systems; scan for drift quarterly; remediate deviations.",
-                "default_test_procedure": "Review baseline documents; verify drift scanning; check deviation remediation.",
-            },
-            "CTL-TP-001": {
-                "objective": "Assess risk from third-party service providers.",
-                "procedure": "Conduct risk assessments for all vendors; tier by criticality; reassess per schedule.",
-                "default_test_procedure": "Review vendor risk assessments; verify tiering methodology; check reassessment compliance.",
-            },
-            "CTL-TP-002": {
-                "objective": "Embed security requirements in vendor contracts.",
-                "procedure": "Include security clauses in all vendor contracts; review during renewals.",
-                "default_test_procedure": "Review sample vendor contracts; verify security clauses present; check renewal reviews.",
-            },
-            "CTL-PS-001": {
-                "objective": "Control physical access to secure areas.",
-                "procedure": "Implement badge access for secure areas; manage visitor logs; review access lists quarterly.",
-                "default_test_procedure": "Review badge access logs; verify visitor management; check quarterly access reviews.",
-            },
-            "CTL-PS-002": {
-                "objective": "Protect facilities from environmental threats.",
-                "procedure": "Maintain fire suppression, HVAC, and UPS systems; test annually; document maintenance.",
-                "default_test_procedure": "Review maintenance records; verify annual testing; check alarm functionality.",
-            },
-            "CTL-SD-001": {
-                "objective": "Integrate security into the software development lifecycle.",
-                "procedure": "Require security reviews at each SDLC phase; maintain secure coding standards; track security defects.",
-                "default_test_procedure": "Review SDLC documentation; verify security gate compliance; check defect tracking.",
-            },
-            "CTL-SD-002": {
-                "objective": "Identify security defects before production deployment.",
-                "procedure": "Require code reviews and SAST scans for all changes; block deployment on critical findings.",
-                "default_test_procedure": "Review code review records; verify SAST scan coverage; check deployment gate enforcement.",
-            },
-            "CTL-AM-001": {
-                "objective": "Maintain comprehensive awareness of all IT assets.",
-                "procedure": "Maintain hardware and software inventory; reconcile quarterly; tag all assets.",
-                "default_test_procedure": "Review asset inventory; verify quarterly reconciliation; sample physical assets against records.",
-            },
-            "CTL-AM-002": {
-                "objective": "Protect endpoints from malware and unauthorized access.",
-                "procedure": "Deploy EDR/antivirus on all endpoints; ensure central management; review detections weekly.",
-                "default_test_procedure": "Verify endpoint coverage rates; review detection logs; test with EICAR samples.",
-            },
-        }
-
-        # Updated framework reference mappings (old → new)
-        ref_updates = {
-            # ISO 27001: 2013 → 2022 numbering
-            ("ISO_27001", "A.9.2.5"): "A.5.18",   # Access rights
-            ("ISO_27001", "A.9.4.2"): "A.8.5",    # Secure authentication
-            ("ISO_27001", "A.9.1.2"): "A.5.15",   # Access control policy
-            ("ISO_27001", "A.10.1.1"): "A.8.24",  # Use of cryptography
-            ("ISO_27001", "A.10.1.2"): "A.8.24",  # Key management
-            ("ISO_27001", "A.16.1.1"): "A.5.24",  # Incident management planning
-            ("ISO_27001", "A.16.1.2"): "A.6.8",   # Reporting security events
-            ("ISO_27001", "A.16.1.6"): "A.5.27",  # Learning from incidents
-            ("ISO_27001", "A.12.6.1"): "A.8.8",   # Management of technical vulnerabilities
-            ("ISO_27001", "A.18.2.3"): "A.5.35",  # Independent review
-            ("ISO_27001", "A.17.1.1"): "A.5.29",  # Info security during disruption
-            ("ISO_27001", "A.17.1.3"): "A.5.30",  # ICT readiness for BC
-            ("ISO_27001", "A.12.3.1"): "A.8.13",  # Information backup
-            ("ISO_27001", "A.5.1.1"): "A.5.1",    # Policies for info security
-            ("ISO_27001", "A.8.2.1"): "A.5.12",   # Classification of information
-            ("ISO_27001", "A.7.2.2"): "A.6.3",    # Security awareness training
-            ("ISO_27001", "A.13.2.1"): "A.5.14",  # Information transfer
-            ("ISO_27001", "A.8.3.2"): "A.7.10",   # Storage media
-            ("ISO_27001", "A.12.4.1"): "A.8.15",  # Logging
-            ("ISO_27001", "A.12.4.2"): "A.8.15",  # Logging (protection)
-            ("ISO_27001", "A.13.1.3"): "A.8.22",  # Segregation of networks
-            ("ISO_27001", "A.13.1.1"): "A.8.20",  # Network security
-            ("ISO_27001", "A.12.1.2"): "A.8.32",  # Change management
-            ("ISO_27001", "A.12.1.1"): "A.8.9",   # Configuration management
-            ("ISO_27001", "A.15.1.1"): "A.5.19",  # Supplier relationships
-            ("ISO_27001", "A.15.1.2"): "A.5.20",  # Supplier agreements
-            ("ISO_27001", "A.11.1.2"): "A.7.2",   # Physical entry
-            ("ISO_27001", "A.11.1.4"): "A.7.5",   # Protecting against threats
-            ("ISO_27001", "A.14.2.1"): "A.8.25",  # Secure development lifecycle
-            ("ISO_27001", "A.14.2.5"): "A.8.29",  # Security testing
-            ("ISO_27001", "A.8.1.1"): "A.5.9",    # Inventory of assets
-            ("ISO_27001", "A.12.2.1"): "A.8.7",   # Protection against malware
-            # NIST CSF: 1.1 → 2.0 numbering
-            ("NIST_CSF_2", "PR.AC-1"): "PR.AA-01",
-            ("NIST_CSF_2", "PR.AC-7"): "PR.AA-03",
-            ("NIST_CSF_2", "PR.AC-4"): "PR.AA-05",
-            ("NIST_CSF_2", "PR.DS-1"): "PR.DS-01",
-            ("NIST_CSF_2", "PR.DS-2"): "PR.DS-02",
-            ("NIST_CSF_2", "PR.DS-5"): "PR.DS-10",
-            ("NIST_CSF_2", "RS.RP-1"): "RS.MA-01",
-            ("NIST_CSF_2", "DE.AE-5"): "DE.AE-07",
-            ("NIST_CSF_2", "RS.IM-1"): "RS.MA-05",
-            ("NIST_CSF_2", "DE.CM-8"): "DE.CM-09",
-            ("NIST_CSF_2", "DE.CM-4"): "DE.CM-01",
-            ("NIST_CSF_2", "PR.IP-12"): "PR.PS-02",
-            ("NIST_CSF_2", "RC.RP-1"): "RC.RP-01",
-            ("NIST_CSF_2", "GV.PO-1"): "GV.PO-01",
-            ("NIST_CSF_2", "ID.RA-1"): "ID.RA-01",
-            ("NIST_CSF_2", "PR.AT-1"): "PR.AT-01",
-            ("NIST_CSF_2", "ID.AM-5"): "ID.AM-05",
-            ("NIST_CSF_2", "PR.IP-6"): "PR.DS-11",
-            ("NIST_CSF_2", "DE.AE-3"): "DE.AE-03",
-            ("NIST_CSF_2", "PR.PT-1"): "PR.PS-01",
-            ("NIST_CSF_2", "PR.AC-5"): "PR.AA-06",
-            ("NIST_CSF_2", "PR.PT-4"): "PR.IR-01",
-            ("NIST_CSF_2", "PR.IP-3"): "PR.PS-04",
-            ("NIST_CSF_2", "PR.IP-1"): "PR.PS-01",
-            ("NIST_CSF_2", "ID.SC-1"): "GV.SC-01",
-            ("NIST_CSF_2", "ID.SC-3"): "GV.SC-05",
-            ("NIST_CSF_2", "PR.AC-2"): "PR.AA-02",
-            ("NIST_CSF_2", "PR.IP-5"): "PR.PS-05",
-            ("NIST_CSF_2", "PR.IP-2"): "PR.PS-06",
-            ("NIST_CSF_2", "PR.IP-4"): "PR.DS-11",
-            ("NIST_CSF_2", "ID.AM-1"): "ID.AM-01",
-        }
-
-        for ctrl in db.query(Control).all():
-            enrich = enrichments.get(ctrl.control_ref)
-            if enrich:
-                if not ctrl.objective:
-                    ctrl.objective = enrich.get("objective")
-                if not ctrl.procedure:
-                    ctrl.procedure = enrich.get("procedure")
-                if not ctrl.default_test_procedure:
-                    ctrl.default_test_procedure = enrich.get("default_test_procedure")
-
-        # Update framework mapping references
-        for mapping in db.query(ControlFrameworkMapping).all():
-            key = (mapping.framework, mapping.reference)
-            if key in ref_updates:
-                mapping.reference = ref_updates[key]
-
-        db.commit()
-    finally:
-        db.close()
+    Also updates framework mapping references from 2013/1.1 numbering to 2022/2.0.
+    Controls seeded by seed_default_controls already carry both, so this only writes on upgraded databases."""
+    from app.services.control_seeds import CONTROL_ENRICHMENTS, CONTROL_REF_UPDATES
+
+    # Fill only the empty fields in one executemany keyed by control_ref; SQLite skips
+    # controls that are already complete, so nothing is read back into Python
+    fields = ("objective", "procedure", "default_test_procedure")
+    incomplete = " OR ".join(f"coalesce({f}, '') = ''" for f in fields)
+    # Skip the per-ref executemany entirely once every control is enriched
+    if db.execute(text(f"SELECT 1 FROM controls WHERE {incomplete} LIMIT 1")).first() is not None:
+        db.execute(text(
+            "UPDATE controls SET "
+            + ", ".join(f"{f} = coalesce(nullif({f}, ''), :{f})" for f in fields)
+            + f" WHERE control_ref = :ref AND ({incomplete})"
+        ), [
+            {"ref": ref, **{f: enrich.get(f) for f in fields}}
+            for ref, enrich in CONTROL_ENRICHMENTS.items()
+        ])
+
+    # Update framework mapping references in one UPDATE ... CASE over all old → new pairs
+    params = {}
+    whens, keys = [], []
+    for i, ((framework, old_ref), new_ref) in enumerate(CONTROL_REF_UPDATES.items()):
+        params.update({f"f{i}": framework, f"o{i}": old_ref, f"n{i}": new_ref})
+        whens.append(f"WHEN framework = :f{i} AND reference = :o{i} THEN :n{i}")
+        keys.append(f"(:f{i}, :o{i})")
+    db.execute(text(
+        f"UPDATE control_framework_mappings SET reference = CASE {' '.join(whens)} ELSE reference END "
+        f"WHERE (framework, reference) IN (VALUES {', '.join(keys)})"
+    ), params)
 
 
 # ==================== CUSTOM FRAMEWORKS ====================
@@ -3238,7 +3306,7 @@ class FrameworkRequirement(Base):
     __tablename__ = "framework_requirements"
 
     id = Column(Integer, primary_key=True, index=True)
-    framework = Column(String(50), nullable=False, index=True)
+    framework = Column(String(50), nullable=False)  # leading column of ix_fw_req_framework_reference
     reference = Column(String(100), nullable=False, index=True)
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
@@ -3252,7 +3320,8 @@ class FrameworkRequirement(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
-        # Unique constraint on (framework, reference)
+        # Not UNIQUE: create_requirement / CSV import do not dedupe before flushing
+        Index("ix_fw_req_framework_reference", "framework", "reference"),
         {"sqlite_autoincrement": True},
     )
 
@@ -3262,7 +3331,7 @@ class FrameworkAdoption(Base):
     __tablename__ = "framework_adoptions"
 
     id = Column(Integer, primary_key=True, index=True)
-    framework = Column(String(50), nullable=False, index=True)
+    framework = Column(String(50), nullable=False)  # leading column of ix_fw_adoption_framework_reference
     requirement_reference = Column(String(100), nullable=False, index=True)
     status = Column(String(30), default=ADOPTION_STATUS_NOT_ADDRESSED, nullable=False)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=True)
@@ -3274,104 +3343,113 @@ class FrameworkAdoption(Base):
     adopted_by = relationship("User", foreign_keys=[adopted_by_user_id])
 
     __table_args__ = (
+        # One adoption per mapped control, so (framework, requirement_reference) repeats
+        Index("ix_fw_adoption_framework_reference", "framework", "requirement_reference"),
         {"sqlite_autoincrement": True},
     )
 
 
 def backfill_framework_tables():
-    """Create framework_requirements and framework_adoptions tables if missing."""
-    db = SessionLocal()
-    try:
-        existing_tables = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
-        if "framework_requirements" not in existing_tables:
-            FrameworkRequirement.__table__.create(engine, checkfirst=True)
-        if "framework_adoptions" not in existing_tables:
-            FrameworkAdoption.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
-
-
-def seed_framework_requirements():
+    """Create framework_requirements and framework_adoptions tables if missing, and their
+    composite (framework, reference) indexes in place of the single-column framework ones."""
+    with engine.begin() as conn:
+        # One sqlite_master read answers every table/index existence check below
+        # (checkfirst would probe once per table and once per index)
+        existing = {(kind, name) for kind, name in conn.execute(text("SELECT type, name FROM sqlite_master"))}
+        for model in (FrameworkRequirement, FrameworkAdoption):
+            if ("table", model.__tablename__) not in existing:
+                model.__table__.create(conn, checkfirst=False)  # also creates its indexes
+                continue
+            for index in model.__table__.indexes:
+                if ("index", index.name) not in existing:
+                    index.create(conn, checkfirst=False)
+
+        for old_index in ("ix_framework_requirements_framework", "ix_framework_adoptions_framework"):
+            if ("index", old_index) in existing:
+                conn.execute(text(f"DROP INDEX {old_index}"))
+
+
+def seed_framework_requirements(db):
     """Load canonical framework requirements from seed data, seeding any missing frameworks."""
-    db = SessionLocal()
-    try:
-        from app.services.framework_seeds import get_all_framework_seeds
-        seeds = get_all_framework_seeds()
-
-        # Find which frameworks already have seeds in DB
-        existing_frameworks = set(
-            r[0] for r in db.query(FrameworkRequirement.framework).distinct().all()
-        )
-
-        new_seeds = [s for s in seeds if s["framework"] not in existing_frameworks]
-        if not new_seeds:
-            return
-
-        for s in new_seeds:
-            db.add(FrameworkRequirement(
-                framework=s["framework"],
-                reference=s["reference"],
-                title=s["title"],
-                description=s.get("description", ""),
-                guidance=s.get("guidance"),
-                category=s.get("category"),
-                subcategory=s.get("subcategory"),
-                suggested_domain=s.get("suggested_domain"),
-                suggested_control_type=s.get("suggested_control_type"),
-                sort_order=s.get("sort_order", 0),
-            ))
-        db.commit()
-    finally:
-        db.close()
+    from app.services.framework_seeds import get_all_framework_seeds
+    seeds = get_all_framework_seeds()
 
+    # Find which frameworks already have seeds in DB
+    existing_frameworks = set(
+        r[0] for r in db.query(FrameworkRequirement.framework).distinct().all()
+    )
 
-def sync_adoptions_from_existing_mappings():
+    new_seeds = [s for s in seeds if s["framework"] not in existing_frameworks]
+    if not new_seeds:
+        return
+
+    # One ORM bulk INSERT (batched by insertmanyvalues) instead of an object per requirement;
+    # created_at is SQLite's CURRENT_TIMESTAMP (UTC) inline rather than a bound utcnow() per row
+    db.execute(insert(FrameworkRequirement).values(created_at=func.now()), [{
+        "framework": s["framework"],
+        "reference": s["reference"],
+        "title": s["title"],
+        "description": s.get("description", ""),
+        "guidance": s.get("guidance"),
+        "category": s.get("category"),
+        "subcategory": s.get("subcategory"),
+        "suggested_domain": s.get("suggested_domain"),
+        "suggested_control_type": s.get("suggested_control_type"),
+        "sort_order": s.get("sort_order", 0),
+    } for s in new_seeds])
+
+
+def sync_adoptions_from_existing_mappings(db):
     """Create FrameworkAdoption records for existing ControlFrameworkMapping rows
     that match seeded requirements (one-time sync for existing databases)."""
+    # Only sync if we have requirements but no adoptions yet
+    if db.query(FrameworkAdoption.id).first() is not None:
+        return
+    if db.query(FrameworkRequirement.id).first() is None:
+        return
+
+    # One INSERT ... SELECT: SQLite matches mappings to requirements through the composite
+    # (framework, reference) indexes. EXISTS (not JOIN) keeps one adoption per mapping even if a
+    # requirement reference is duplicated. adopted_at comes from SQLite's CURRENT_TIMESTAMP (UTC).
+    db.execute(text(
+        "INSERT INTO framework_adoptions (framework, requirement_reference, status, control_id, adopted_at) "
+        "SELECT m.framework, m.reference, :status, m.control_id, CURRENT_TIMESTAMP "
+        "FROM control_framework_mappings m "
+        "WHERE EXISTS (SELECT 1 FROM framework_requirements r "
+        "WHERE r.framework = m.framework AND r.reference = m.reference) "
+        "ORDER BY m.id"
+    ), {"status": ADOPTION_STATUS_MAPPED})
+
+
+def initialize_controls():
+    """Seed controls and framework requirements, sync adoptions and apply enrichments
+    as one startup transaction (one commit; rolled back as a unit on failure)."""
     db = SessionLocal()
     try:
-        # Only sync if we have requirements but no adoptions yet
-        if db.query(FrameworkAdoption).count() > 0:
-            return
-        if db.query(FrameworkRequirement).count() == 0:
-            return
-
-        # Build lookup of seeded requirements
-        reqs = db.query(FrameworkRequirement).all()
-        req_set = {(r.framework, r.reference) for r in reqs}
-
-        # Find existing mappings that match
-        mappings = db.query(ControlFrameworkMapping).all()
-        for m in mappings:
-            if (m.framework, m.reference) in req_set:
-                db.add(FrameworkAdoption(
-                    framework=m.framework,
-                    requirement_reference=m.reference,
-                    status=ADOPTION_STATUS_MAPPED,
-                    control_id=m.control_id,
-                    adopted_at=datetime.utcnow(),
-                ))
+        seed_default_controls(db)
+        seed_framework_requirements(db)
+        sync_adoptions_from_existing_mappings(db)
+        update_control_enrichments(db)
         db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
 
 def backfill_custom_frameworks_table():
     """Create custom_frameworks table if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         if "custom_frameworks" not in existing:
-            CustomFramework.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+            CustomFramework.__table__.create(conn, checkfirst=False)
 
 
 def backfill_policy_tables():
     """Create policy-related tables if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("policies", Policy),
             ("policy_versions", PolicyVersion),
@@ -3380,16 +3458,13 @@ def backfill_policy_tables():
             ("policy_acknowledgments", PolicyAcknowledgment),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+                model.__table__.create(conn, checkfirst=False)
 
 
 def backfill_risk_tables():
     """Create risk register tables if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("risks", Risk),
             ("risk_control_mappings", RiskControlMapping),
@@ -3397,25 +3472,20 @@ def backfill_risk_tables():
             ("org_risk_snapshots", OrgRiskSnapshot),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+                model.__table__.create(conn, checkfirst=False)
 
 
 def backfill_audit_project_tables():
     """Create audit readiness tables if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("audit_projects", AuditProject),
             ("audit_requests", AuditRequest),
             ("audit_request_evidence", AuditRequestEvidence),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+                model.__table__.create(conn, checkfirst=False)
 
 
 def seed_default_policies():
@@ -3790,7 +3860,8 @@ INTAKE_STATUS_UNDER_REVIEW = "UNDER_REVIEW"
 INTAKE_STATUS_ACCEPTED = "ACCEPTED"
 INTAKE_STATUS_REJECTED = "REJECTED"
 INTAKE_STATUS_CONVERTED = "CONVERTED"
-VALID_INTAKE_STATUSES = [INTAKE_STATUS_SUBMITTED, INTAKE_STATUS_UNDER_REVIEW, INTAKE_STATUS_ACCEPTED, INTAKE_STATUS_REJECTED, INTAKE_STATUS_CONVERTED]
+VALID_INTAKE_STATUSES_ORDERED = (INTAKE_STATUS_SUBMITTED, INTAKE_STATUS_UNDER_REVIEW, INTAKE_STATUS_ACCEPTED, INTAKE_STATUS_REJECTED, INTAKE_STATUS_CONVERTED)
+VALID_INTAKE_STATUSES = frozenset(VALID_INTAKE_STATUSES_ORDERED)
 INTAKE_STATUS_LABELS = {
     INTAKE_STATUS_SUBMITTED: "Submitted",
     INTAKE_STATUS_UNDER_REVIEW: "Under Review",
@@ -4043,9 +4114,8 @@ class RiskAssessmentTemplate(Base):
 
 def backfill_incident_tables():
     """Create incident management tables if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("incidents", Incident),
             ("incident_timeline", IncidentTimeline),
@@ -4053,31 +4123,25 @@ def backfill_incident_tables():
             ("incident_risk_mappings", IncidentRiskMapping),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+                model.__table__.create(conn, checkfirst=False)
 
 
 def backfill_asset_tables():
     """Create asset inventory tables if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("assets", Asset),
             ("asset_control_mappings", AssetControlMapping),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+                model.__table__.create(conn, checkfirst=False)
 
 
 def backfill_risk_assessment_tables():
     """Create risk assessment tables if missing, and add FAIR/simulation columns."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         for tbl_name, model in [
             ("risk_assessments", RiskAssessment),
             ("risk_assessment_items", RiskAssessmentItem),
@@ -4087,7 +4151,7 @@ def backfill_risk_assessment_tables():
             ("risk_simulation_runs", RiskSimulationRun),
         ]:
             if tbl_name not in existing:
-                model.__table__.create(engine, checkfirst=True)
+                model.__table__.create(conn, checkfirst=False)
 
         # ALTER TABLE: add FAIR factor columns to risk_assessment_items
         fair_columns = [
@@ -4098,14 +4162,14 @@ def backfill_risk_assessment_tables():
             ("asset_id", "INTEGER"), ("vendor_link_id", "INTEGER"),
             ("treatment_decision", "VARCHAR(20)"), ("treatment_decision_rationale", "TEXT"),
         ]
+        existing_cols = {row[1] for row in conn.execute(_pragma_table_info("risk_assessment_items"))}
         for col_name, col_type in fair_columns:
+            if col_name in existing_cols:
+                continue
             try:
-                db.execute(text(f"ALTER TABLE risk_assessment_items ADD COLUMN {col_name} {col_type}"))
-                db.commit()
+                conn.execute(text(f"ALTER TABLE risk_assessment_items ADD COLUMN {col_name} {col_type}"))
             except Exception:
-                db.rollback()
-    finally:
-        db.close()
+                pass  # added concurrently; SQLite keeps the transaction open
 
 
 def seed_default_assessment_templates():
@@ -4146,13 +4210,10 @@ def seed_default_assessment_templates():
 
 def backfill_trust_center_table():
     """Create trust center config table if missing."""
-    db = SessionLocal()
-    try:
-        existing = {r[0] for r in db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()}
+    with engine.begin() as conn:
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars())
         if "trust_center_config" not in existing:
-            TrustCenterConfig.__table__.create(engine, checkfirst=True)
-    finally:
-        db.close()
+            TrustCenterConfig.__table__.create(conn, checkfirst=False)
 
 
 def ensure_trust_center_config(db):
@@ -1,8 +1,13 @@
 """One-time script to populate the database with 10 demo vendors and realistic assessment data."""
 import random
 import json
+from collections import defaultdict
+from itertools import accumulate
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+
 from models import (
     SessionLocal, Vendor, Assessment, Question, Response, Answer,
     AssessmentDecision, QuestionBankItem,
@@ -19,7 +24,7 @@ from models import (
     DECISION_NEEDS_FOLLOW_UP, DECISION_REJECT,
 )
 from app.services.scoring import compute_assessment_scores, suggest_risk_level
-from app.services.token import generate_unique_token
+from app.services.token import generate_unique_tokens
 
 random.seed(42)
 
@@ -37,6 +42,12 @@ VENDORS = [
 ]
 
 WEIGHT_DIST = [WEIGHT_LOW] * 1 + [WEIGHT_MEDIUM] * 5 + [WEIGHT_HIGH] * 3 + [WEIGHT_CRITICAL] * 1
+EXPECTED_DIST = ["yes", "yes", "yes", "partial"]
+# Serialized expected_values for each drawn expectation ("partial" also accepts "yes")
+EXPECTED_VALUES_JSON = {
+    "yes": json.dumps(["yes"]),
+    "partial": json.dumps(["yes", "partial"]),
+}
 
 # Profiles: (answer distribution, question count range, assessment title pattern)
 VENDOR_PROFILES = [
@@ -56,9 +67,15 @@ VENDOR_PROFILES = [
     {"bias": {"yes": 0.55, "partial": 0.25, "no": 0.15, "na": 0.05}, "q_range": (18, 28), "quality": "mixed"},
     {"bias": {"yes": 0.60, "partial": 0.18, "no": 0.17, "na": 0.05}, "q_range": (10, 18), "quality": "mixed"},
 ]
+# Answer pool and cumulative weights per profile, built once for the per-assessment answer draw
+for _profile in VENDOR_PROFILES:
+    _profile["answers"] = tuple(_profile["bias"])
+    _profile["cum_weights"] = tuple(accumulate(_profile["bias"].values()))
 
 SENSITIVITY_OPTIONS = ["LOW", "MEDIUM", "HIGH", "VERY_HIGH"]
 CRITICALITY_OPTIONS = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+IMPACT_OPTIONS = (RISK_LEVEL_LOW, RISK_LEVEL_MODERATE, RISK_LEVEL_HIGH, RISK_LEVEL_VERY_HIGH)
+LIKELIHOOD_OPTIONS = (RISK_LEVEL_LOW, RISK_LEVEL_MODERATE, RISK_LEVEL_HIGH)
 
 TITLES = [
     "Annual Security Review 2025",
@@ -73,27 +90,35 @@ TITLES = [
     "Enhanced Due Diligence",
 ]
 
+# In-progress/draft assessments (no decision) added for pipeline variety: (status, title)
+EXTRA_ASSESSMENTS = [
+    (ASSESSMENT_STATUS_DRAFT, "Draft Security Review"),
+    (ASSESSMENT_STATUS_SENT, "Pending Vendor Response"),
+    (ASSESSMENT_STATUS_IN_PROGRESS, "In-Progress Assessment"),
+    (ASSESSMENT_STATUS_SUBMITTED, "Awaiting Internal Review"),
+]
+
 RATIONALE_TEMPLATES = {
-    "great": [
+    "great": (
         "Vendor demonstrates mature security practices across all assessed domains. Strong controls in access management, encryption, and incident response. Minimal gaps identified.",
         "Comprehensive security program with well-documented policies. SOC 2 Type II certified with no material exceptions. Recommend continued engagement.",
-    ],
-    "good": [
+    ),
+    "good": (
         "Vendor meets most security requirements with minor gaps in documentation and monitoring. Recommend approval with periodic review to track improvements.",
         "Overall solid security posture. Some areas require attention, particularly around vulnerability management cadence and log forwarding capabilities.",
-    ],
-    "mediocre": [
+    ),
+    "mediocre": (
         "Vendor demonstrates inconsistent security practices. While some controls are in place, significant gaps exist in encryption key management and incident response procedures.",
         "Mixed results across assessment categories. Access controls are adequate but continuous monitoring and BC/DR capabilities require substantial improvement.",
-    ],
-    "poor": [
+    ),
+    "poor": (
         "Vendor fails to meet minimum security requirements in multiple critical areas. Systemic deficiencies in access control, encryption, and incident response noted.",
         "Assessment reveals fundamental gaps in the vendor's security program. Lack of documented policies, inadequate monitoring, and missing certifications present unacceptable risk.",
-    ],
-    "mixed": [
+    ),
+    "mixed": (
         "Vendor shows strong capabilities in some areas but notable weaknesses in others. Encryption and access control are solid, but incident response and vendor management need work.",
         "Security posture varies significantly across domains. Recommend conditional approval with specific remediation requirements and accelerated review timeline.",
-    ],
+    ),
 }
 
 FINDINGS_TEMPLATES = {
@@ -113,12 +138,6 @@ REMEDIATION_TEMPLATES = {
 }
 
 
-def pick_answer(bias):
-    choices = list(bias.keys())
-    weights = list(bias.values())
-    return random.choices(choices, weights=weights, k=1)[0]
-
-
 def risk_to_outcome(risk_level):
     mapping = {
         RISK_LEVEL_VERY_LOW: DECISION_APPROVE,
@@ -131,7 +150,9 @@ def risk_to_outcome(risk_level):
 
 
 def main():
-    db = SessionLocal()
+    # Only counts are printed after the commit, so the loaded bank items need not be expired
+    db = SessionLocal(expire_on_commit=False)
+    now = datetime.utcnow()  # one reference time, so offsets between seeded timestamps are exact
     try:
         # Get all active question bank items grouped by category
         bank_items = db.query(QuestionBankItem).filter(
@@ -142,36 +163,44 @@ def main():
             print("ERROR: No question bank items found. Run the app first to seed them.")
             return
 
-        categories = {}
+        categories = defaultdict(list)
         for item in bank_items:
-            categories.setdefault(item.category, []).append(item)
+            categories[item.category].append(item)
 
-        cat_names = list(categories.keys())
+        cat_names = list(categories)
         print(f"Found {len(bank_items)} bank items across {len(cat_names)} categories")
 
         created_vendors = 0
         created_assessments = 0
 
+        # One read of the existing vendors answers every "already exists" check below and
+        # supplies the pool the extra assessments are attached to
+        existing_vendors = [tuple(v) for v in db.query(Vendor.id, Vendor.name).order_by(Vendor.id)]
+        existing_names = {name for _, name in existing_vendors}
+
+        # Stage every row first, then insert one table at a time in a single statement each
+        # instead of an add + flush per row. The seeded data is reproducible, but the batched
+        # random draws give a different stream than the old per-row loop did.
+        vendor_rows, assessment_rows, decision_rows = [], [], []
+        question_groups, answer_groups = [], []
+
         for i, (vendor_info, profile) in enumerate(zip(VENDORS, VENDOR_PROFILES)):
             name, contact_name, contact_email = vendor_info
 
             # Check if vendor already exists
-            existing = db.query(Vendor).filter(Vendor.name == name).first()
-            if existing:
+            if name in existing_names:
                 print(f"  Skipping {name} — already exists")
                 continue
 
             # Create vendor
-            vendor = Vendor(
+            vendor_rows.append(dict(
                 name=name,
                 primary_contact_name=contact_name,
                 primary_contact_email=contact_email,
                 notes=f"Demo vendor — {profile['quality']} security posture",
                 status=VENDOR_STATUS_ACTIVE if i < 9 else VENDOR_STATUS_ARCHIVED,
-                created_at=datetime.utcnow() - timedelta(days=random.randint(30, 365)),
-            )
-            db.add(vendor)
-            db.flush()
+                created_at=now - timedelta(days=random.randint(30, 365)),
+            ))
             created_vendors += 1
 
             # Pick random subset of categories and questions
@@ -182,124 +211,151 @@ def main():
                 cat_items = categories[cat]
                 take = min(random.randint(2, len(cat_items)), len(cat_items))
                 selected_items.extend(random.sample(cat_items, take))
-            random.shuffle(selected_items)
-            selected_items = selected_items[:q_count]
+            # A k-sample is a random ordered subset, same as shuffling the whole pool and slicing
+            selected_items = random.sample(selected_items, min(q_count, len(selected_items)))
 
-            # Create assessment
-            token = generate_unique_token(db)
+            # Create assessment (vendor_id and token assigned after staging)
             days_ago = random.randint(5, 180)
-            assessment = Assessment(
+            assessment = dict(
                 company_name=name,
                 title=TITLES[i],
-                token=token,
-                vendor_id=vendor.id,
                 status=ASSESSMENT_STATUS_REVIEWED,
-                created_at=datetime.utcnow() - timedelta(days=days_ago),
-                submitted_at=datetime.utcnow() - timedelta(days=days_ago - 3),
-                reviewed_at=datetime.utcnow() - timedelta(days=max(1, days_ago - 10)),
+                created_at=now - timedelta(days=days_ago),
+                submitted_at=now - timedelta(days=days_ago - 3),
+                reviewed_at=now - timedelta(days=max(1, days_ago - 10)),
             )
-            db.add(assessment)
-            db.flush()
+            assessment_rows.append(assessment)
 
-            # Create questions
+            # Create questions; weights and expectations are drawn for the whole assessment at once
+            weights = random.choices(WEIGHT_DIST, k=len(selected_items))
+            expectations = random.choices(EXPECTED_DIST, k=len(selected_items))
             questions = []
-            for order, item in enumerate(selected_items):
-                weight = random.choice(WEIGHT_DIST)
-                expected = random.choice(["yes", "yes", "yes", "partial"])
-                expected_list = ["yes"] if expected == "yes" else ["yes", "partial"]
-                q = Question(
-                    assessment_id=assessment.id,
+            for order, (item, weight, expected) in enumerate(zip(selected_items, weights, expectations)):
+                questions.append(dict(
                     question_text=item.text,
                     order=order,
                     weight=weight,
                     expected_operator="EQUALS",
-                    expected_value=expected_list[0],
-                    expected_values=json.dumps(expected_list),
+                    expected_value="yes",
+                    expected_values=EXPECTED_VALUES_JSON[expected],
                     expected_value_type="CHOICE",
                     answer_mode="SINGLE",
                     category=item.category,
                     question_bank_item_id=item.id,
                     answer_options=item.answer_options,
-                )
-                db.add(q)
-                questions.append(q)
-            db.flush()
-
-            # Create response with answers
-            response = Response(
-                assessment_id=assessment.id,
-                vendor_name=name,
-                vendor_email=contact_email,
-                status=RESPONSE_STATUS_SUBMITTED,
-                submitted_at=assessment.submitted_at,
-            )
-            db.add(response)
-            db.flush()
-
-            for q in questions:
-                answer_choice = pick_answer(profile["bias"])
-                answer = Answer(
-                    response_id=response.id,
-                    question_id=q.id,
-                    answer_choice=answer_choice,
-                )
-                db.add(answer)
-            db.flush()
-
-            # Compute scores to drive the decision
-            scores = compute_assessment_scores(questions, response)
-            overall_score = scores["overall_score"]
-            risk_level = scores["suggested_risk_level"] if overall_score is not None else RISK_LEVEL_MODERATE
-            outcome = risk_to_outcome(risk_level)
+                ))
+            answer_choices = random.choices(profile["answers"], cum_weights=profile["cum_weights"], k=len(questions))
+            question_groups.append(questions)
+            answer_groups.append(answer_choices)
 
-            # Create finalized assessment decision
+            # Create finalized assessment decision; its rating and outcome come from the
+            # scores, which are computed once the questions and answers are inserted
             review_offset = random.randint(90, 365)
             quality = profile["quality"]
-            decision = AssessmentDecision(
-                vendor_id=vendor.id,
-                assessment_id=assessment.id,
+            decision_rows.append(dict(
                 status=DECISION_STATUS_FINAL,
                 data_sensitivity=random.choice(SENSITIVITY_OPTIONS),
                 business_criticality=random.choice(CRITICALITY_OPTIONS),
-                impact_rating=random.choice([RISK_LEVEL_LOW, RISK_LEVEL_MODERATE, RISK_LEVEL_HIGH, RISK_LEVEL_VERY_HIGH]),
-                likelihood_rating=random.choice([RISK_LEVEL_LOW, RISK_LEVEL_MODERATE, RISK_LEVEL_HIGH]),
-                overall_risk_rating=risk_level,
-                decision_outcome=outcome,
+                impact_rating=random.choice(IMPACT_OPTIONS),
+                likelihood_rating=random.choice(LIKELIHOOD_OPTIONS),
                 rationale=random.choice(RATIONALE_TEMPLATES[quality]),
                 key_findings=FINDINGS_TEMPLATES[quality],
                 remediation_required=REMEDIATION_TEMPLATES[quality],
-                next_review_date=datetime.utcnow() + timedelta(days=review_offset) if i < 7 else datetime.utcnow() - timedelta(days=random.randint(5, 60)),
-                created_at=assessment.reviewed_at,
-                finalized_at=assessment.reviewed_at,
-            )
-            db.add(decision)
+                next_review_date=now + timedelta(days=review_offset) if i < 7 else now - timedelta(days=random.randint(5, 60)),
+                created_at=assessment["reviewed_at"],
+                finalized_at=assessment["reviewed_at"],
+            ))
             created_assessments += 1
 
-            print(f"  {name}: {len(questions)} questions, score={overall_score}, risk={risk_level}, outcome={outcome}")
-
-        # Also create a couple of in-progress/draft assessments (no decision) for pipeline variety
-        extra_statuses = [
-            (ASSESSMENT_STATUS_DRAFT, "Draft Security Review"),
-            (ASSESSMENT_STATUS_SENT, "Pending Vendor Response"),
-            (ASSESSMENT_STATUS_IN_PROGRESS, "In-Progress Assessment"),
-            (ASSESSMENT_STATUS_SUBMITTED, "Awaiting Internal Review"),
-        ]
-        # Attach these to random existing vendors
-        all_vendors = db.query(Vendor).all()
-        for status, title in extra_statuses:
-            v = random.choice(all_vendors)
-            token = generate_unique_token(db)
-            extra = Assessment(
-                company_name=v.name,
+        # RETURNING hands back each table's new ids in row order, so children get their
+        # foreign keys without a flush per parent. The ids come back with the INSERT itself, so
+        # there is no extra round trip to save by assigning them client-side (SQLite has no
+        # sequence to reserve from, and max(id) + 1 would race a running app instance).
+        vendor_ids = db.execute(
+            insert(Vendor).returning(Vendor.id, sort_by_parameter_order=True), vendor_rows
+        ).scalars().all() if vendor_rows else []
+        for vendor_id, assessment in zip(vendor_ids, assessment_rows):
+            assessment["vendor_id"] = vendor_id
+
+        # Also create a couple of in-progress/draft assessments (no decision) for pipeline variety,
+        # attached to random vendors (pre-existing or just inserted, in id order)
+        all_vendors = existing_vendors + [(vendor_id, row["name"]) for vendor_id, row in zip(vendor_ids, vendor_rows)]
+        for status, title in EXTRA_ASSESSMENTS:
+            vendor_id, vendor_name = random.choice(all_vendors)
+            assessment_rows.append(dict(
+                company_name=vendor_name,
                 title=title,
-                token=token,
-                vendor_id=v.id,
+                vendor_id=vendor_id,
                 status=status,
-                created_at=datetime.utcnow() - timedelta(days=random.randint(1, 30)),
-            )
-            db.add(extra)
+                created_at=now - timedelta(days=random.randint(1, 30)),
+            ))
             created_assessments += 1
 
+        # One uniqueness check for every token this run needs, then one INSERT for all assessments
+        for assessment, token in zip(assessment_rows, generate_unique_tokens(db, len(assessment_rows))):
+            assessment["token"] = token
+        assessment_ids = db.execute(
+            insert(Assessment).returning(Assessment.id, sort_by_parameter_order=True), assessment_rows
+        ).scalars().all()
+
+        if vendor_rows:
+            # The demo vendors' assessments come first, so zip() pairs them with their questions,
+            # responses and decisions and leaves the extra assessments out
+            question_ids = iter(db.execute(
+                insert(Question).returning(Question.id, sort_by_parameter_order=True),
+                [
+                    dict(q, assessment_id=assessment_id)
+                    for assessment_id, questions in zip(assessment_ids, question_groups)
+                    for q in questions
+                ],
+            ).scalars().all())
+            response_ids = db.execute(
+                insert(Response).returning(Response.id, sort_by_parameter_order=True),
+                [
+                    dict(
+                        assessment_id=assessment_id,
+                        vendor_name=vendor["name"],
+                        vendor_email=vendor["primary_contact_email"],
+                        status=RESPONSE_STATUS_SUBMITTED,
+                        submitted_at=assessment["submitted_at"],
+                    )
+                    for assessment_id, vendor, assessment in zip(assessment_ids, vendor_rows, assessment_rows)
+                ],
+            ).scalars().all()
+
+            # Questions were inserted vendor by vendor, so their ids line up with the answer groups;
+            # the whole run's answers go out as one executemany INSERT
+            db.execute(insert(Answer), [
+                dict(response_id=response_id, question_id=next(question_ids), answer_choice=choice)
+                for response_id, answer_choices in zip(response_ids, answer_groups)
+                for choice in answer_choices
+            ])
+
+            # Score each demo assessment from the rows just inserted to drive its decision
+            questions_by_assessment = defaultdict(list)
+            for question in db.query(Question).filter(
+                Question.assessment_id.in_(assessment_ids[:len(vendor_rows)])
+            ).order_by(Question.assessment_id, Question.order):
+                questions_by_assessment[question.assessment_id].append(question)
+            responses = db.query(Response).options(selectinload(Response.answers)).filter(
+                Response.id.in_(response_ids)
+            ).order_by(Response.id).all()
+
+            for vendor, vendor_id, assessment_id, response, decision in zip(
+                vendor_rows, vendor_ids, assessment_ids, responses, decision_rows
+            ):
+                questions = questions_by_assessment[assessment_id]
+                scores = compute_assessment_scores(questions, response)
+                overall_score = scores["overall_score"]
+                risk_level = scores["suggested_risk_level"] if overall_score is not None else RISK_LEVEL_MODERATE
+                outcome = risk_to_outcome(risk_level)
+                decision.update(
+                    vendor_id=vendor_id, assessment_id=assessment_id,
+                    overall_risk_rating=risk_level, decision_outcome=outcome,
+                )
+                print(f"  {vendor['name']}: {len(questions)} questions, score={overall_score}, risk={risk_level}, outcome={outcome}")
+            db.bulk_insert_mappings(AssessmentDecision, decision_rows)
+
         db.commit()
         print(f"\nDone! Created {created_vendors} vendors and {created_assessments} assessments.")
 
@@ -5,8 +5,12 @@ Run once:  python seed_workspace.py
 """
 import random
 from datetime import datetime, timedelta
+from itertools import chain
 
 import bcrypt
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+
 from models import (
     SessionLocal, User, Vendor, Assessment, RemediationItem, VendorActivity,
     VENDOR_STATUS_ACTIVE,
@@ -23,7 +27,8 @@ random.seed(99)
 
 
 def main():
-    db = SessionLocal()
+    # The users, vendors and assessments loaded below are not touched after the commit
+    db = SessionLocal(expire_on_commit=False)
     try:
         # ==================== 1. ENSURE ANALYST USER ====================
         analyst = db.query(User).filter(User.email == "analyst@example.com").first()
@@ -68,7 +73,8 @@ def main():
             elif i < len(active_vendors) * 0.9:
                 v.assigned_analyst_id = analyst.id
             # else: leave unassigned
-        db.flush()
+        # No flush here or after the assessment pass: nothing below reads these back from the
+        # database (a.vendor resolves from the identity map), so the final commit writes both
 
         admin_vendors = [v for v in active_vendors if v.assigned_analyst_id == admin.id]
         analyst_vendors = [v for v in active_vendors if v.assigned_analyst_id == analyst.id]
@@ -76,7 +82,8 @@ def main():
         print(f"Assigned: {len(admin_vendors)} to admin, {len(analyst_vendors)} to analyst, {len(unassigned)} unassigned")
 
         # ==================== 3. ASSIGN ASSESSMENTS ====================
-        all_assessments = db.query(Assessment).all()
+        # Vendors come with the assessments (one query), so a.vendor never lazy-loads in the loop
+        all_assessments = db.query(Assessment).options(joinedload(Assessment.vendor)).all()
         assigned_count = 0
         for a in all_assessments:
             if a.assigned_analyst_id:
@@ -91,7 +98,6 @@ def main():
                 else:
                     a.assigned_analyst_id = a.vendor.assigned_analyst_id
                 assigned_count += 1
-        db.flush()
         print(f"Directly assigned {assigned_count} assessments at assessment level")
 
         # ==================== 4. ADD REMEDIATIONS FOR WORKSPACE ====================
@@ -118,8 +124,9 @@ def main():
         ).count()
 
         if existing_manual == 0:
-            created_rems = 0
-            for v in admin_vendors + analyst_vendors:
+            # Plain rows, inserted as one executemany INSERT once all draws are made
+            rem_rows = []
+            for v in chain(admin_vendors, analyst_vendors):
                 # 2-4 remediations per vendor
                 count = random.randint(1, 4)
                 titles = random.sample(remediation_titles, min(count, len(remediation_titles)))
@@ -135,7 +142,7 @@ def main():
                     if random.random() < 0.3:
                         assigned_user = admin.id if v.assigned_analyst_id == analyst.id else analyst.id
 
-                    rem = RemediationItem(
+                    rem_rows.append(dict(
                         vendor_id=v.id,
                         title=title,
                         description=f"Remediation item for {v.name}: {title}",
@@ -145,11 +152,10 @@ def main():
                         assigned_to_user_id=assigned_user,
                         due_date=due,
                         created_at=now - timedelta(days=random.randint(5, 60)),
-                    )
-                    db.add(rem)
-                    created_rems += 1
-            db.flush()
-            print(f"Created {created_rems} remediation items")
+                    ))
+            if rem_rows:
+                db.execute(insert(RemediationItem), rem_rows)
+            print(f"Created {len(rem_rows)} remediation items")
         else:
             print(f"Remediations already seeded ({existing_manual} found)")
 
@@ -163,12 +169,12 @@ def main():
                 (ACTIVITY_VENDOR_SUBMITTED, "Vendor submitted assessment response"),
                 (ACTIVITY_DECISION_FINALIZED, "Assessment decision finalized"),
             ]
-            created_acts = 0
-            for v in admin_vendors + analyst_vendors:
+            act_rows = []
+            for v in chain(admin_vendors, analyst_vendors):
                 for _ in range(random.randint(2, 5)):
                     act_type, desc = random.choice(activity_types)
                     user_id = v.assigned_analyst_id or admin.id
-                    act = VendorActivity(
+                    act_rows.append(dict(
                         vendor_id=v.id,
                         activity_type=act_type,
                         description=f"{desc} — {v.name}",
@@ -178,11 +184,10 @@ def main():
                             hours=random.randint(0, 23),
                             minutes=random.randint(0, 59),
                         ),
-                    )
-                    db.add(act)
-                    created_acts += 1
-            db.flush()
-            print(f"Created {created_acts} activity entries")
+                    ))
+            if act_rows:
+                db.execute(insert(VendorActivity), act_rows)
+            print(f"Created {len(act_rows)} activity entries")
         else:
             print(f"Activities already populated ({existing_activities} found)")
 
@@ -0,0 +1,70 @@
+"""Concurrent audit_logs writers must extend one unbroken hash chain."""
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from models import Base, SessionLocal, AuditLog, Vendor, apply_sqlite_pragmas, engine
+from app.services.audit_service import log_audit, verify_audit_chain
+
+THREADS = 4
+COMMITS_PER_THREAD = 50
+
+
+@pytest.fixture
+def audit_db(tmp_path):
+    """Point SessionLocal at a fresh WAL database with the app's pragmas."""
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'audit.db'}", connect_args={"check_same_thread": False}
+    )
+    event.listen(test_engine, "connect", lambda dbapi_conn, record: apply_sqlite_pragmas(dbapi_conn))
+    Base.metadata.create_all(test_engine)
+    SessionLocal.configure(bind=test_engine)
+    try:
+        yield test_engine
+    finally:
+        SessionLocal.configure(bind=engine)
+        test_engine.dispose()
+
+
+def _audit_only(worker):
+    for i in range(COMMITS_PER_THREAD):
+        db = SessionLocal()
+        try:
+            log_audit(db, "CREATE", "VENDOR", entity_id=i, description=f"worker {worker}")
+            db.commit()
+        finally:
+            db.close()
+
+
+def _change_then_audit(worker):
+    # The entity INSERT is flushed ahead of the audit row, so the chain tip is read
+    # inside a transaction that already holds the write lock
+    for i in range(COMMITS_PER_THREAD):
+        db = SessionLocal()
+        try:
+            vendor = Vendor(name=f"Vendor {worker}-{i}")
+            db.add(vendor)
+            db.flush()
+            log_audit(db, "CREATE", "VENDOR", entity_id=vendor.id, entity_label=vendor.name)
+            db.commit()
+        finally:
+            db.close()
+
+
+@pytest.mark.parametrize("work", [_audit_only, _change_then_audit])
+def test_concurrent_writers_keep_chain_intact(audit_db, work):
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    db = SessionLocal()
+    try:
+        assert db.query(AuditLog).count() == THREADS * COMMITS_PER_THREAD
+        # A fork shows up as two rows chained onto the same predecessor
+        assert db.query(AuditLog.prev_hash).distinct().count() == THREADS * COMMITS_PER_THREAD
+        assert verify_audit_chain(db) is None
+    finally:
+        db.close()